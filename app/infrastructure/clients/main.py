@@ -28,6 +28,9 @@ class MainClient(AsyncMixin):
         self._user_api = f"{main_service._event_config.base_url}/{main_service._event_config.user_endpoint}"
         self._spin_api = f"{main_service._event_config.base_url}/{main_service._event_config.spin_endpoint}"
 
+        # Shared HTTP session, reused by every lookup/spin so the connection pool stays warm
+        self._session = aiohttp.ClientSession(**self.client_params)
+
     @property
     def client_params(self) -> Dict[str, Any]:
         return {
@@ -36,30 +39,33 @@ class MainClient(AsyncMixin):
             "connector": request_mgr.insecure_connector,
         }
 
+    async def aclose(self) -> None:
+        if not self._session.closed:
+            await self._session.close()
+
     async def lookup(self, silent: bool = False) -> Optional[UserReponse]:
         try:
-            async with aiohttp.ClientSession(**self.client_params) as session:
-                async with session.get(url=self._user_api) as response:
-                    if not response.ok:
-                        message = f"User API request failed with status: {response.status}"
-                        logger.error(f"{message} - {await response.text(encoding='utf-8')}")
+            async with self._session.get(url=self._user_api) as response:
+                if not response.ok:
+                    message = f"User API request failed with status: {response.status}"
+                    logger.error(f"{message} - {await response.text(encoding='utf-8')}")
 
-                        if not silent:
-                            self._on_add_message(tag=MessageTag.ERROR, message=message)
+                    if not silent:
+                        self._on_add_message(tag=MessageTag.ERROR, message=message)
 
-                        return None
+                    return None
 
-                    user_response = UserReponse.model_validate(await response.json())
-                    if user_response.invalid_response:
-                        if not silent:
-                            self._on_add_message(tag=MessageTag.ERROR, message=user_response.invalid_message)
+                user_response = UserReponse.model_validate(await response.json())
+                if user_response.invalid_response:
+                    if not silent:
+                        self._on_add_message(tag=MessageTag.ERROR, message=user_response.invalid_message)
 
-                        return None
+                    return None
 
-                    if not silent:
-                        self._on_add_message(tag=MessageTag.SUCCESS, message="Lookup user info successfully")
+                if not silent:
+                    self._on_add_message(tag=MessageTag.SUCCESS, message="Lookup user info successfully")
 
-                    return user_response
+                return user_response
 
         except Exception as error:
             logger.exception(f"Failed to lookup user info: {error}")
@@ -130,15 +136,14 @@ class MainClient(AsyncMixin):
 
             payload = {"free_spin_amount": free_spin, "spin_type": 0, "payment_type": payment_type}
 
-        async with aiohttp.ClientSession(**self.client_params) as session:
-            async with session.post(url=self._spin_api, json=payload) as response:
-                if not response.ok:
-                    spin_type = "Free spin" if is_free_spin else "Spin"
-                    message = f"{spin_type} API request failed with status: {response.status}"
-                    logger.error(f"{message} - {await response.text(encoding='utf-8')}")
-                    self._on_add_message(tag=MessageTag.ERROR, message=message)
-                    return None
+        async with self._session.post(url=self._spin_api, json=payload) as response:
+            if not response.ok:
+                spin_type = "Free spin" if is_free_spin else "Spin"
+                message = f"{spin_type} API request failed with status: {response.status}"
+                logger.error(f"{message} - {await response.text(encoding='utf-8')}")
+                self._on_add_message(tag=MessageTag.ERROR, message=message)
+                return None
 
-                # Return response even if it has error_code, let caller handle it
-                spin_response = SpinResponse.model_validate(await response.json())
-                return spin_response
+            # Return response even if it has error_code, let caller handle it
+            spin_response = SpinResponse.model_validate(await response.json())
+            return spin_response
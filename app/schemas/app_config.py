@@ -1,7 +1,10 @@
-from typing import Any, Dict, List
+from functools import cached_property
+from typing import Any, Dict, List, Tuple
 
 from pydantic import BaseModel
 
+from app.schemas.enums.payment_type import PaymentType
+
 
 class AppConfigs(BaseModel):
     is_active: bool = False
@@ -25,6 +28,18 @@ class EventConfigs(BaseModel):
     password_input_selector: str = "form input[type='password']"
     submit_btn_selector: str = "form button[type='submit']"
 
+    @cached_property
+    def spin_type_options(self) -> Dict[int, Tuple[str, ...]]:
+        # Display options ("1. 20 FC Spin", ...) keyed by payment type value, formatted once per event.
+        # Tuples, since the cached options are shared by every dialog for the life of the process
+        return {
+            payment_type.value: tuple(
+                f"{i}. {spin_type.replace('Spin', f'{payment_type.text} Spin')}"
+                for i, spin_type in enumerate(self.spin_types, start=1)
+            )
+            for payment_type in PaymentType
+        }
+
 
 class Configs(BaseModel):
     app_configs: AppConfigs
@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Dict
 
 
 class PaymentType(Enum):
@@ -7,8 +8,12 @@ class PaymentType(Enum):
 
     @property
     def text(self) -> str:
-        return "FC" if self == PaymentType.FC else "MC"
+        return self.name
 
     @staticmethod
     def from_int(value: int) -> "PaymentType":
-        return PaymentType.FC if value == 1 else PaymentType.MC
+        return _PAYMENT_TYPE_BY_VALUE.get(value, PaymentType.MC)
+
+
+# Value -> member table for from_int (unknown values fall back to MC)
+_PAYMENT_TYPE_BY_VALUE: Dict[int, PaymentType] = {payment_type.value: payment_type for payment_type in PaymentType}
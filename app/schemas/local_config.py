@@ -1,14 +1,15 @@
 from datetime import datetime
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from app.schemas.app_config import EventConfigs
 from app.schemas.enums.payment_type import PaymentType
 
 
 class Notification(BaseModel):
-    timestamp: str = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
+    # Stamped per instance - a plain default would be evaluated once, at import time
+    timestamp: str = Field(default_factory=lambda: datetime.now().strftime("%d/%m/%Y %H:%M:%S"))
     nickname: str = ""
     jackpot_value: str = ""
     is_seen: bool = False
@@ -35,8 +36,7 @@ class Account(BaseModel):
 
     def spin_type_name(self, event_configs: Dict[str, EventConfigs], selected_event: str) -> str:
         base_name = event_configs[selected_event].spin_types[self.spin_type - 1]
-        payment_prefix = "FC" if self.payment_type == PaymentType.FC else "MC"
-        return base_name.replace("Spin", f"{payment_prefix} Spin")
+        return base_name.replace("Spin", f"{self.payment_type.text} Spin")
 
     def running_message(self, event_configs: Dict[str, EventConfigs], selected_event: str) -> str:
         spin_type_name = self.spin_type_name(event_configs=event_configs, selected_event=selected_event)
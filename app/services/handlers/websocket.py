@@ -26,7 +26,40 @@ if TYPE_CHECKING:
 class WebsocketHandler:
     # Regex pattern to extract socket payload from websocket frames
     # Format: 42[{"content": {...}}] where 42 is the socket.io message prefix
-    _SOCKET_PAYLOAD_RE = re.compile(r"42(\[.*\])")
+    # Anchored and used with .match() so non-event frames are rejected at the first characters
+    _SOCKET_PAYLOAD_RE = re.compile(r"^42(\[.*\])")
+
+    # Fixed attribute layout - these are read on every websocket frame
+    __slots__ = (
+        # Browser configs
+        "_page",
+        # Account configs
+        "_event_config",
+        "_account",
+        # Callbacks
+        "_on_account_won",
+        "_on_update_account_info",
+        "_on_update_current_jackpot",
+        "_on_update_prize_winner",
+        "_on_add_message",
+        "_on_add_notification",
+        # Internal state
+        "_current_jackpot",
+        "_is_logged_in",
+        "_user_info",
+        "_main_client",
+        "_user_nick_cf",
+        "_user_acct_cf",
+        # Special jackpot tracking
+        "_jackpot_epoch",
+        "_sjp_spin_lock",
+        "_sjp_spin_task",
+        "_sjp_last_spin_time",
+        # Mini jackpot tracking
+        "_mjp_spin_lock",
+        "_mjp_spin_task",
+        "_has_spun_for_mini_jackpot",
+    )
 
     def __init__(self, main_service: "MainService") -> None:
         # Browser configs
@@ -50,6 +83,10 @@ class WebsocketHandler:
         self._user_info: Optional[UserReponse] = None
         self._main_client: Optional[MainClient] = None
 
+        # Casefolded identity of the logged-in user, refreshed whenever user info changes
+        self._user_nick_cf: str = ""
+        self._user_acct_cf: str = ""
+
         # Special jackpot tracking
         self._jackpot_epoch: int = 0
         self._sjp_spin_lock = asyncio.Lock()
@@ -76,6 +113,7 @@ class WebsocketHandler:
     @user_info.setter
     def user_info(self, new_user_info: UserReponse) -> None:
         self._user_info = new_user_info
+        self._cache_user_identity()
 
     @property
     def main_client(self) -> Optional[MainClient]:
@@ -123,7 +161,7 @@ class WebsocketHandler:
 
     async def _parse_socket_frame(self, frame: str) -> Optional[Tuple[str, int | str, str]]:
         # Extract the JSON payload from socket.io message format
-        m = self._SOCKET_PAYLOAD_RE.search(frame)
+        m = self._SOCKET_PAYLOAD_RE.match(frame)
         if not m:
             return None
 
@@ -158,13 +196,20 @@ class WebsocketHandler:
         try:
             match kind:
                 case "jackpot_value" | "prize_change":
-                    message = f"Jackpot value: {int(value):,}"
-                    self._on_add_message(tag=MessageTag.WEBSOCKET, message=message, compact=True)
-
-                    # Handle real-time jackpot value updates
+                    # Bind hot values to locals - this branch runs on every jackpot tick
+                    account = self._account
+                    username = account.username
+                    target_mjp = account.target_mjp
+                    target_sjp = account.target_sjp
                     new_value = int(value)
                     prev_value = self._current_jackpot
 
+                    # Most ticks repeat the previous value - only format and push the message on change
+                    is_changed = new_value != prev_value
+                    if is_changed:
+                        message = f"Jackpot value: {new_value:,}"
+                        self._on_add_message(tag=MessageTag.WEBSOCKET, message=message, compact=True)
+
                     # Detect jackpot reset/drop - increase epoch and cancel pending spins
                     if new_value < prev_value:
                         self._jackpot_epoch += 1
@@ -173,57 +218,53 @@ class WebsocketHandler:
                     self._current_jackpot = new_value
 
                     # Check if mini jackpot target reached (spin once only)
-                    if (
-                        self._account.target_mjp is not None
-                        and new_value >= self._account.target_mjp
-                        and not self._has_spun_for_mini_jackpot
-                    ):
+                    if target_mjp is not None and new_value >= target_mjp and not self._has_spun_for_mini_jackpot:
                         # Clean up any completed tasks first
                         self._cleanup_completed_mjp_spin_task()
 
                         # Trigger one-time mini jackpot spin
                         if not self._mjp_spin_task:
-                            message = f"Mini Jackpot target reached {self._account.target_mjp:,}, spinning once"
+                            message = f"Mini Jackpot target reached {target_mjp:,}, spinning once"
                             self._on_add_message(tag=MessageTag.REACHED_GOAL, message=message)
 
                             epoch_snapshot = self._jackpot_epoch
                             self._mjp_spin_task = asyncio.create_task(
                                 self._attempt_spin(epoch_snapshot=epoch_snapshot, is_jackpot=False),
-                                name=f"spin-mjp-{self._account.username}-{epoch_snapshot}",
+                                name=f"spin-mjp-{username}-{epoch_snapshot}",
                             )
                             logger.info(
-                                f"Created one-time mini jackpot spin task for {self._account.username} "
-                                f"at jackpot {new_value:,}"
+                                f"Created one-time mini jackpot spin task for {username} at jackpot {new_value:,}"
                             )
 
                     # Check if special jackpot target reached (continuous spins)
-                    elif new_value >= self._account.target_sjp:
+                    elif new_value >= target_sjp:
                         # Clean up any completed tasks first
                         self._cleanup_completed_sjp_spin_task()
 
                         # Check if we should trigger a new spin based on delay
                         current_time = time.time()
-                        time_since_last_spin = current_time - self._sjp_last_spin_time
+                        last_spin_time = self._sjp_last_spin_time
 
                         # Trigger spin if: no active task AND (first spin OR enough delay passed)
                         should_spin = not self._sjp_spin_task and (
-                            self._sjp_last_spin_time == 0.0 or time_since_last_spin >= self._account.spin_delay_seconds
+                            last_spin_time == 0.0 or current_time - last_spin_time >= account.spin_delay_seconds
                         )
 
                         if should_spin:
-                            if self._sjp_last_spin_time == 0.0:
-                                message = f"Special Jackpot has reached {self._account.target_sjp:,}"
+                            if last_spin_time == 0.0:
+                                message = f"Special Jackpot has reached {target_sjp:,}"
                                 self._on_add_message(tag=MessageTag.REACHED_GOAL, message=message)
 
                             epoch_snapshot = self._jackpot_epoch
                             self._sjp_spin_task = asyncio.create_task(
                                 self._attempt_spin(epoch_snapshot=epoch_snapshot),
-                                name=f"spin-{self._account.username}-{epoch_snapshot}",
+                                name=f"spin-{username}-{epoch_snapshot}",
                             )
                             self._sjp_last_spin_time = current_time
-                            logger.info(f"Created spin task for {self._account.username} at jackpot {new_value:,}")
+                            logger.info(f"Created spin task for {username} at jackpot {new_value:,}")
 
-                    self._on_update_current_jackpot(value=new_value)
+                    if is_changed:
+                        self._on_update_current_jackpot(value=new_value)
 
                 case "jackpot" | "mini_jackpot":
                     # Stop auto spin when any jackpot is won by anyone
@@ -305,6 +346,7 @@ class WebsocketHandler:
 
             if self._user_info and spin_response and spin_response.payload and spin_response.payload.user:
                 self._user_info.payload.user = spin_response.payload.user
+                self._cache_user_identity()
                 self._on_update_account_info(username=self._account.username, user_detail=spin_response.payload.user)
 
             self._sjp_spin_task = None
@@ -314,15 +356,10 @@ class WebsocketHandler:
                 self._has_spun_for_mini_jackpot = True
 
     async def _check_winner(self, is_jackpot: bool, target_nickname: str, target_value: int | str) -> None:
-        try:
-            user = self._user_info and self._user_info.payload and self._user_info.payload.user
-            target_nickname = target_nickname.casefold()
-            is_me = (
-                (target_nickname == user.nickname_norm or target_nickname == user.account_name_norm) if user else False
-            )
-
-        except Exception:
-            is_me = False
+        target_nickname = (target_nickname or "").casefold()
+        is_me = bool(target_nickname) and (
+            target_nickname == self._user_nick_cf or target_nickname == self._user_acct_cf
+        )
 
         prefix = "You" if is_me else f"User '{target_nickname}'"
         suffix = "Ultimate Prize" if is_jackpot else "Mini Prize"
@@ -337,12 +374,17 @@ class WebsocketHandler:
 
             self._on_add_notification(nickname=target_nickname, jackpot_value=str(target_value))
 
-            notifier_mgr.discord_winner_notifier(
-                is_jackpot=is_jackpot,
-                username=self._account.username,
-                nickname=target_nickname,
-                value=str(target_value),
-            )
+            # Discord webhook is a blocking HTTP call - keep it off the event loop
+            threading.Thread(
+                target=notifier_mgr.discord_winner_notifier,
+                kwargs={
+                    "is_jackpot": is_jackpot,
+                    "username": self._account.username,
+                    "nickname": target_nickname,
+                    "value": str(target_value),
+                },
+                daemon=True,
+            ).start()
 
         is_compact = False if is_me else True
         self._on_add_message(tag=tag, message=message, compact=is_compact)
@@ -350,6 +392,11 @@ class WebsocketHandler:
 
         threading.Thread(target=play_audio, kwargs={"audio_name": tag.sound_name}, daemon=True).start()
 
+    def _cache_user_identity(self) -> None:
+        user = self._user_info.payload.user if self._user_info else None
+        self._user_nick_cf = user.nickname_norm if user else ""
+        self._user_acct_cf = user.account_name_norm if user else ""
+
     def _cancel_spin_task(self) -> None:
         if self._sjp_spin_task and not self._sjp_spin_task.done():
             logger.info(f"Cancelling pending spin task for {self._account.username} (epoch {self._jackpot_epoch})")
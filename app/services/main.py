@@ -1,5 +1,5 @@
 import asyncio
-import time
+import contextlib
 from typing import Optional, Tuple
 
 from browser_use import BrowserProfile, BrowserSession
@@ -77,9 +77,15 @@ class MainService:
         self._user_data_dir: Optional[str] = None
         self._user_info: Optional[UserReponse] = None
 
+        # API client (created once per run and shared across refreshes)
+        self.client: Optional[MainClient] = None
+
         # Auto refresh configuration
         self._refresh_interval = 60 * 60  # 60 minutes in seconds
-        self._last_refresh_time: Optional[float] = None
+
+        # Stop signal - set from any thread via the is_running setter to wake the main loop
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_event = asyncio.Event()
 
     @property
     def page(self) -> Optional[Page]:
@@ -93,7 +99,13 @@ class MainService:
     def is_running(self, value: bool) -> None:
         self._is_running = value
 
+        # asyncio.Event is not thread-safe, so hand the wake-up to the owning loop
+        if not value and self._loop and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._stop_event.set)
+
     async def run(self) -> None:
+        self._loop = asyncio.get_running_loop()
+
         try:
             # Initialize browser session and navigate to target URL
             self._session, self._page = await self._setup_browser()
@@ -124,34 +136,39 @@ class MainService:
             self.websocket_handler.user_info = self._user_info
             self.websocket_handler.main_client = self.client
 
-            # Main monitoring loop - keep running until stopped
-            self._last_refresh_time = time.time()
+            # Main monitoring loop - sleep until stopped or the next auto-refresh is due
+            refresh_interval = self._refresh_interval if self._auto_refresh else None
             while self._is_running:
-                # Auto-refresh browser session periodically to avoid stale sessions (if enabled)
-                if self._auto_refresh:
-                    current_time = time.time()
-                    if (current_time - self._last_refresh_time) >= self._refresh_interval:
-                        message = "Refreshing browser session to maintain stability..."
-                        self._on_add_message(tag=MessageTag.INFO, message=message)
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=refresh_interval)
+
+                if not self._is_running:
+                    break
 
-                        run_in_thread(coro_func=self._page.reload)
-                        self._last_refresh_time = current_time
-                        await self._page.wait_for_load_state(state="networkidle")
+                # Auto-refresh browser session periodically to avoid stale sessions (if enabled)
+                message = "Refreshing browser session to maintain stability..."
+                self._on_add_message(tag=MessageTag.INFO, message=message)
 
-                        # Ensure user is still logged in after refresh
-                        await login_handler.ensure_logged_in()
-                        await self._page.wait_for_load_state(state="networkidle")
+                run_in_thread(coro_func=self._page.reload)
+                await self._page.wait_for_load_state(state="networkidle")
 
-                        # Re-fetch user info after refresh
-                        self._user_info = await self.client.lookup()
-                        self._update_ui()
+                # Ensure user is still logged in after refresh
+                await login_handler.ensure_logged_in()
+                await self._page.wait_for_load_state(state="networkidle")
 
-                await asyncio.sleep(delay=0.1)
+                # Re-fetch user info after refresh
+                self._user_info = await self.client.lookup()
+                self._update_ui()
 
         except Exception as error:
             raise error
 
         finally:
+            # Close the shared HTTP session on the loop that owns it
+            if self.client:
+                await self.client.aclose()
+                self.client = None
+
             await self.close()
             self._on_add_message(tag=MessageTag.INFO, message=f"{settings.program_name} stopped", compact=True)
 
@@ -1,6 +1,6 @@
 import tkinter as tk
 from tkinter import ttk
-from typing import Callable, List
+from typing import Callable, List, Optional, Tuple
 
 from app.schemas.local_config import Notification
 from app.ui.utils.ui_factory import UIFactory
@@ -9,6 +9,11 @@ from app.utils.helpers import get_window_position
 
 
 class NotificationDialog(tk.Toplevel):
+    # The option database is shared by the whole interpreter - register the dialog options once per process
+    _is_appearance_configured = False
+
+    _SIZE = (400, 500)  # Fixed (width, height) of the non-resizable dialog
+
     def __init__(
         self,
         parent: tk.Misc,
@@ -17,34 +22,64 @@ class NotificationDialog(tk.Toplevel):
     ) -> None:
         super().__init__(master=parent)
 
+        # Widgets
+        self._parent = parent
+
         # Configs
         self._notifications = notifications
 
         # Callbacks
         self._on_clear_all = on_clear_all
 
+        # States
+        self._list_job: Optional[str] = None
+        self._is_list_shown: Optional[bool] = None  # None until the first render packs either state
+        self._row_chunks: List[Tuple[str, ...]] = []  # Formatted (chars, tags) per notification, in list order
+
         self.title(string="Notifications")
         self.resizable(width=False, height=False)
-        self.geometry(newGeometry="400x500")
 
         # Make menu floating (always on top)
         self.attributes("-topmost", True)
         self.transient(master=parent)  # type: ignore[call-overload]
 
-        # Center the menu window
-        self.update_idletasks()
-        _, _, _, _, x, y = get_window_position(child_frame=self, parent_frame=parent)
-        self.geometry(newGeometry=f"400x500+{x}+{y}")
+        # The dialog is reused across icon clicks - closing it only hides the window
+        self.protocol(name="WM_DELETE_WINDOW", func=self.hide)
 
         # Configure menu appearance
         self._configure_appearance()
         self._initialize()
+        self.show()
+
+    # ==================== Public Methods ====================
+    def show(self) -> None:
+        # Center the menu window - the size is fixed, so no layout pass is needed to measure it
+        _, _, width, height, x, y = get_window_position(child_frame=self, parent_frame=self._parent, size=self._SIZE)
+        self.geometry(newGeometry=f"{width}x{height}+{x}+{y}")
+        self.deiconify()
+        self.lift()
+
+        # Rows are rendered once the dialog is on screen so opening it does not block on a long list
+        if self._list_job is None:
+            self._list_job = self.after_idle(self._render_notifications)
+
+    def hide(self) -> None:
+        if self._list_job is not None:
+            self.after_cancel(id=self._list_job)
+            self._list_job = None
 
+        self.withdraw()
+
+    # ==================== Private Methods ====================
     def _configure_appearance(self) -> None:
         self.configure(bg="#1f2937")
+        if NotificationDialog._is_appearance_configured:
+            return
+
         self.option_add(pattern="*TFrame*background", value="#1f2937")
         self.option_add(pattern="*TLabel*background", value="#1f2937")
         self.option_add(pattern="*TButton*background", value="#374151")
+        NotificationDialog._is_appearance_configured = True
 
     def _initialize(self) -> None:
         main_frame = ttk.Frame(master=self, padding=20)
@@ -59,98 +94,114 @@ class NotificationDialog(tk.Toplevel):
         )
         title_label.pack(pady=(0, 20))
 
-        # Content area
+        # Content area - holds either the empty state or the list, swapped on each render
         content_frame = ttk.Frame(master=main_frame)
         content_frame.pack(fill="both", expand=True)
 
-        if not self._notifications:
-            self._setup_empty_state(parent=content_frame)
-        else:
-            self._setup_notifications_list(parent=content_frame)
+        self._setup_empty_state(parent=content_frame)
+        self._setup_notifications_list(parent=content_frame)
 
         # Buttons - always at the bottom
         self._setup_buttons(parent=main_frame)
 
     def _setup_empty_state(self, parent: tk.Misc) -> None:
-        no_notifications_label = ttk.Label(
+        self._empty_label = ttk.Label(
             parent,
             font=("Arial", 14),
             foreground="#6b7280",
             text="📭 No notifications",
         )
-        no_notifications_label.pack(expand=True)
 
     def _setup_notifications_list(self, parent: tk.Misc) -> None:
-        # Create scrollable frame using helper
-        canvas, scrollbar, scrollable_frame = UIHelpers.create_scrollable_frame(parent=parent)
-
-        # Sort notifications: unseen first, then by timestamp descending
-        sorted_notifications = sorted(
-            self._notifications,
-            key=lambda x: (x.is_seen, x.timestamp),
-            reverse=True,
+        self._list_frame = ttk.Frame(master=parent)
+
+        # A single Text widget renders every notification through tags and only lays out the visible lines
+        self._list_text, scrollbar = UIFactory.create_text_widget(
+            parent=self._list_frame,
+            height=1,
+            bg="#1f2937",
+            highlightthickness=0,
+            padx=10,
+            pady=10,
+            cursor="arrow",
+            state="disabled",
         )
-
-        # Add each notification
-        for notification in sorted_notifications:
-            self._create_notification_item(parent=scrollable_frame, notification=notification)
-
-        # Pack canvas and scrollbar
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-
-    def _create_notification_item(self, parent: tk.Misc, notification: Notification) -> None:
-        notification_frame = ttk.Frame(master=parent)
-        notification_frame.pack(fill="x", pady=(0, 10))
-
-        # Notification content
-        notification_content_frame = ttk.Frame(master=notification_frame, padding=10)
-        notification_content_frame.pack(fill="x")
-
-        # Timestamp
-        time_label = ttk.Label(
-            master=notification_content_frame,
-            font=("Arial", 10),
-            foreground="#9ca3af",
-            text=f"Time: {notification.timestamp}",
-        )
-        time_label.pack(anchor="w", pady=(0, 5))
-
-        # Nickname
-        nickname_label = ttk.Label(
-            master=notification_content_frame,
-            font=("Arial", 12, "bold"),
-            foreground="#22c55e",
-            text=f"User: {notification.nickname}",
-        )
-        nickname_label.pack(anchor="w")
-
-        # Jackpot value
-        jackpot_label = ttk.Label(
-            master=notification_content_frame,
-            font=("Arial", 14, "bold"),
-            foreground="#f97316",
-            text=f"Reward: {notification.jackpot_value}",
+        self._list_text.tag_configure("time", font=("Arial", 10), foreground="#9ca3af", spacing3=5)
+        self._list_text.tag_configure("nickname", font=("Arial", 12, "bold"), foreground="#22c55e")
+        self._list_text.tag_configure(
+            "jackpot", font=("Arial", 14, "bold"), foreground="#f97316", spacing1=5, spacing3=30
         )
-        jackpot_label.pack(anchor="w", pady=(5, 0))
+        UIHelpers.prevent_text_selection(text_widget=self._list_text)
+
+        # Pack text widget and scrollbar
+        self._list_text.pack(side="left", fill="both", expand=True)
+        if scrollbar:
+            scrollbar.pack(side="right", fill="y")
 
     def _setup_buttons(self, parent: tk.Misc) -> None:
         button_frame = ttk.Frame(master=parent)
         button_frame.pack(side="bottom", fill="x", pady=(20, 0))
 
-        if self._notifications:
-            # Clear all button
-            clear_btn = UIFactory.create_button(
-                parent=button_frame,
-                text="Clear All",
-                command=self._on_clear_all,
-            )
-            clear_btn.pack(side="left")
+        # Clear all button - packed only while there are notifications
+        self._clear_btn = UIFactory.create_button(
+            parent=button_frame,
+            text="Clear All",
+            command=self._handle_clear_all,
+        )
 
         # Close button (always visible)
         close_btn = UIFactory.create_button(
             parent=button_frame,
             text="Close",
-            command=self.destroy,
+            command=self.hide,
         )
         close_btn.pack(side="right")
+
+    def _handle_clear_all(self) -> None:
+        self._row_chunks.clear()
+        self._on_clear_all()
+
+    def _render_notifications(self) -> None:
+        self._list_job = None
+
+        # Swap between the empty state and the list only when that actually changes
+        has_notifications = bool(self._notifications)
+        if has_notifications != self._is_list_shown:
+            if has_notifications:
+                self._empty_label.pack_forget()
+                self._list_frame.pack(fill="both", expand=True)
+                self._clear_btn.pack(side="left")
+            else:
+                self._list_frame.pack_forget()
+                self._clear_btn.pack_forget()
+                self._empty_label.pack(expand=True)
+
+            self._is_list_shown = has_notifications
+
+        # Notifications are only appended (or cleared through this dialog), so cached rows align by position
+        for notification in self._notifications[len(self._row_chunks) :]:
+            self._row_chunks.append(
+                (
+                    f"Time: {notification.timestamp}\n",
+                    "time",
+                    f"User: {notification.nickname}\n",
+                    "nickname",
+                    f"Reward: {notification.jackpot_value}\n",
+                    "jackpot",
+                )
+            )
+
+        # Unseen first, newest first within each group - notifications are appended as they arrive, so reversed
+        # insertion order is already chronological (the "%d/%m/%Y" timestamps do not sort correctly as strings)
+        newest_first = list(zip(self._notifications, self._row_chunks, strict=True))[::-1]
+        sorted_rows = [row for n, row in newest_first if not n.is_seen] + [row for n, row in newest_first if n.is_seen]
+
+        # Interleaved (chars, tags) pairs so all rows go in with one insert call
+        chunks = [chunk for row in sorted_rows for chunk in row]
+
+        self._list_text.configure(state="normal")
+        self._list_text.delete("1.0", tk.END)
+        if chunks:
+            self._list_text.insert("1.0", *chunks)
+        self._list_text.configure(state="disabled")
+        self._list_text.yview_moveto(0)
@@ -1,12 +1,11 @@
 import tkinter as tk
 from tkinter import messagebox, ttk
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple
 
 from app.schemas.app_config import EventConfigs
 from app.schemas.enums.payment_type import PaymentType
 from app.schemas.local_config import Account
 from app.ui.utils.ui_factory import UIFactory
-from app.ui.utils.ui_helpers import UIHelpers
 from app.utils.helpers import get_window_position
 
 
@@ -14,7 +13,25 @@ class _OnSaveCallback(Protocol):
     def __call__(self, account: Account, is_new: bool) -> None: ...
 
 
+def _validate_int(value: str) -> bool:
+    if value == "":
+        return True
+
+    try:
+        int(value)
+        return True
+    except ValueError:
+        return False
+
+
 class UpsertAccountDialog:
+    # Shared style for form labels - configured once instead of passing a font tuple per label
+    _FORM_LABEL_STYLE = "Form.TLabel"
+    _is_style_configured = False
+
+    # Tcl command names of registered validators - shared by every dialog opened on the same root
+    _validate_commands: Dict[str, str] = {}
+
     def __init__(
         self,
         parent: tk.Misc,
@@ -31,24 +48,27 @@ class UpsertAccountDialog:
         # Configs
         self._event_configs = event_configs
         self._selected_event = selected_event
-        self._existing_accounts = existing_accounts
+        self._existing_usernames = frozenset(a.username for a in existing_accounts)
         self._account = account
 
         # Callbacks
         self._on_save = on_save
 
         # States
-        self._is_edit_mode = account is not None and account.username in {a.username for a in existing_accounts}
+        self._is_edit_mode = account is not None and account.username in self._existing_usernames
+        self._original_username = account.username if self._is_edit_mode and account else None
 
         self._initialize()
 
     def _initialize(self) -> None:
         title = "Edit Account" if self._is_edit_mode else "Add New Account"
 
+        # Keep the dialog unmapped while it is built so it is laid out and shown only once
         self._dialog = tk.Toplevel(master=self._parent)
+        self._dialog.withdraw()
         self._dialog.title(string=title)
         self._dialog.transient(master=self._parent)  # type: ignore[call-overload]
-        self._dialog.grab_set()
+        self._configure_styles()
 
         main_frame = ttk.Frame(master=self._dialog, padding=20)
         main_frame.pack(fill="both", expand=True)
@@ -57,77 +77,83 @@ class UpsertAccountDialog:
         title_label = ttk.Label(master=main_frame, text=title, font=("Arial", 16, "bold"))
         title_label.pack(pady=(0, 20))
 
+        # Build the form on the next idle tick so the click that opened the dialog returns right away.
+        # Scheduled on the parent so the callback survives a destroyed dialog and can detect it itself
+        self._parent.after_idle(self._build_and_show, main_frame)
+
+    def _build_and_show(self, main_frame: ttk.Frame) -> None:
+        # The toplevel may already be gone (e.g. the app closed) before this idle tick ran
+        if self._dialog is None or not self._dialog.winfo_exists():
+            return
+
         # Form fields
         self._setup_form_fields(parent=main_frame)
         self._setup_buttons(parent=main_frame)
 
-        # Center and focus
+        # Center using the requested size, then map at the final position
         self._dialog.update_idletasks()
-        _, _, dw, dh, x, y = get_window_position(child_frame=self._dialog, parent_frame=self._parent)
+        _, _, dw, dh, x, y = get_window_position(
+            child_frame=self._dialog,
+            parent_frame=self._parent,
+            size=(self._dialog.winfo_reqwidth(), self._dialog.winfo_reqheight()),
+        )
         self._dialog.geometry(f"{dw}x{dh}+{x}+{y}")
         self._dialog.resizable(False, False)
+        self._dialog.deiconify()
+        self._dialog.grab_set()  # grab requires a viewable window
 
         self._username_entry.focus_set()
 
-        # Bind Enter key to all inputs
-        UIHelpers.bind_enter_key(
-            widgets=[
-                self._username_entry,
-                self._pwd_entry,
-                self._target_sjp_entry,
-                self._target_mjp_entry,
-                self._spin_delay_entry,
-                self._spin_type_combobox,
-                self._close_on_jp_win_checkbox,
-            ],
-            callback=self._handle_save,
-        )
+        # Bind Enter key once on the dialog - every child widget carries the toplevel bindtag
+        self._dialog.bind(sequence="<Return>", func=self._on_return_key)
+
+    @classmethod
+    def _configure_styles(cls) -> None:
+        if cls._is_style_configured:
+            return
+
+        ttk.Style().configure(cls._FORM_LABEL_STYLE, font=("Arial", 12))
+        cls._is_style_configured = True
+
+    def _get_validate_command(self, validator: Callable[[str], bool]) -> Tuple[str, str]:
+        # Register on the long-lived toplevel: commands registered on the dialog die with it
+        if not (command_name := self._validate_commands.get(validator.__name__)):
+            command_name = self._parent.winfo_toplevel().register(validator)
+            self._validate_commands[validator.__name__] = command_name
 
-        self._dialog.wait_window()
+        return command_name, "%P"
 
     def _setup_form_fields(self, parent: ttk.Frame) -> None:
         # Username
-        username_frame, self._username_entry = UIFactory.create_form_row(
+        self._username_var, self._username_entry = self._create_entry_row(
             parent=parent,
             label_text="Username:",
-            widget_type="entry",
+            value=self._account.username if self._account else "",
         )
-        username_frame.pack(fill="x", pady=(0, 15))
-        self._username_var = tk.StringVar(value=(self._account.username if self._account else ""))
-        self._username_entry.config(textvariable=self._username_var)  # type: ignore[attr-defined]
 
         # Password
-        pwd_frame, self._pwd_entry = UIFactory.create_form_row(
+        self._pwd_var, self._pwd_entry = self._create_entry_row(
             parent=parent,
             label_text="Password:",
-            widget_type="entry",
+            value=self._account.password if self._account else "",
             show="*",
         )
-        pwd_frame.pack(fill="x", pady=(0, 15))
-        self._pwd_var = tk.StringVar(value=(self._account.password if self._account else ""))
-        self._pwd_entry.config(textvariable=self._pwd_var)  # type: ignore[attr-defined]
 
         # Target Special Jackpot
-        target_sjp_frame, self._target_sjp_entry = UIFactory.create_form_row(
+        self._target_sjp_var, self._target_sjp_entry = self._create_entry_row(
             parent=parent,
             label_text="Target Jackpot:",
-            widget_type="entry",
+            value=str(self._account.target_sjp if self._account else 18000),
+            validate="key",
+            validatecommand=self._get_validate_command(validator=_validate_int),
         )
-        target_sjp_frame.pack(fill="x", pady=(0, 15))
-        self._target_sjp_var = tk.IntVar(value=(self._account.target_sjp if self._account else 18000))
-        self._target_sjp_entry.config(textvariable=self._target_sjp_var)  # type: ignore[attr-defined]
 
         # Target Mini Jackpot (Optional)
-        target_mjp_frame, self._target_mjp_entry = UIFactory.create_form_row(
+        self._target_mjp_var, self._target_mjp_entry = self._create_entry_row(
             parent=parent,
             label_text="Target Mini JP:",
-            widget_type="entry",
-        )
-        target_mjp_frame.pack(fill="x", pady=(0, 15))
-        self._target_mjp_var = tk.StringVar(
-            value=str(self._account.target_mjp) if self._account and self._account.target_mjp else ""
+            value=str(self._account.target_mjp) if self._account and self._account.target_mjp else "",
         )
-        self._target_mjp_entry.config(textvariable=self._target_mjp_var)  # type: ignore[attr-defined]
 
         # Payment Type and Spin Action
         self._setup_payment_type_and_spin_actions(parent=parent)
@@ -146,11 +172,35 @@ class UpsertAccountDialog:
         )
         self._close_on_jp_win_checkbox.pack(anchor="w")
 
+    def _create_entry_row(
+        self,
+        parent: ttk.Frame,
+        label_text: str,
+        value: str,
+        **entry_kwargs: Any,
+    ) -> Tuple[tk.StringVar, tk.Widget]:
+        # Bind the variable at construction time instead of a follow-up configure call
+        var = tk.StringVar(value=value)
+        row_frame, entry = UIFactory.create_form_row(
+            parent=parent,
+            label_text=label_text,
+            widget_type="entry",
+            label_style=self._FORM_LABEL_STYLE,
+            textvariable=var,
+            **entry_kwargs,
+        )
+        row_frame.pack(fill="x", pady=(0, 15))
+
+        return var, entry
+
     def _setup_payment_type_and_spin_actions(self, parent: ttk.Frame) -> None:
         # Payment Type
         payment_type_frame = ttk.Frame(master=parent)
         payment_type_frame.pack(fill="x", pady=(0, 15))
-        ttk.Label(master=payment_type_frame, text="Payment Type:", width=15, font=("Arial", 12)).pack(side="left")
+        payment_type_label = ttk.Label(
+            master=payment_type_frame, text="Payment Type:", width=15, style=self._FORM_LABEL_STYLE
+        )
+        payment_type_label.pack(side="left")
 
         initial_payment_type = self._account.payment_type.value if self._account else PaymentType.FC.value
         self._payment_type_var = tk.IntVar(value=initial_payment_type)
@@ -158,16 +208,13 @@ class UpsertAccountDialog:
         # Spin Actions Combobox
         spin_type_frame = ttk.Frame(master=parent)
         spin_type_frame.pack(fill="x", pady=(0, 15))
-        ttk.Label(master=spin_type_frame, text="Spin Action:", width=15, font=("Arial", 12)).pack(side="left")
+        spin_type_label = ttk.Label(master=spin_type_frame, text="Spin Action:", width=15, style=self._FORM_LABEL_STYLE)
+        spin_type_label.pack(side="left")
 
-        def get_spin_type_options(payment_type: int) -> List[str]:
-            payment_prefix = PaymentType.from_int(payment_type).text
-            return [
-                f"{i}. {spin_type.replace('Spin', f'{payment_prefix} Spin')}"
-                for i, spin_type in enumerate(self._event_configs[self._selected_event].spin_types, start=1)
-            ]
+        # Option lists for every payment type, formatted once per event so toggling FC/MC is a plain lookup
+        self._spin_type_options = self._event_configs[self._selected_event].spin_type_options
 
-        spin_type_options = get_spin_type_options(self._payment_type_var.get())
+        spin_type_options = self._spin_type_options[self._payment_type_var.get()]
         initial_spin_display = (
             (
                 f"{self._account.spin_type}. "
@@ -184,20 +231,26 @@ class UpsertAccountDialog:
         )
         self._spin_type_combobox.pack(side="left", padx=(10, 0), fill="x", expand=True)
 
-        def on_payment_type_changed(*_: Any) -> None:
-            new_options = get_spin_type_options(self._payment_type_var.get())
-            self._spin_type_combobox.config(values=new_options)
+        last_payment_type = self._payment_type_var.get()
 
-            current_spin_display = self._spin_type_var.get()
-            try:
-                spin_index = int(current_spin_display.split(".")[0])
-            except (ValueError, IndexError):
-                spin_index = 1
+        def on_payment_type_changed() -> None:
+            nonlocal last_payment_type
+
+            # Radio buttons fire their command on every click, even when the value is unchanged
+            payment_type = self._payment_type_var.get()
+            if payment_type == last_payment_type:
+                return
 
-            if 1 <= spin_index <= len(new_options):
-                self._spin_type_var.set(new_options[spin_index - 1])
+            last_payment_type = payment_type
 
-        self._payment_type_var.trace_add("write", on_payment_type_changed)
+            # Selected index in the old option list - must be read before the values are swapped
+            spin_index = self._spin_type_combobox.current()
+
+            new_options = self._spin_type_options[payment_type]
+            self._spin_type_combobox.config(values=new_options)
+
+            if 0 <= spin_index < len(new_options):
+                self._spin_type_var.set(new_options[spin_index])
 
         # Payment radio buttons
         payment_radio_frame = ttk.Frame(master=payment_type_frame)
@@ -208,6 +261,7 @@ class UpsertAccountDialog:
             text=PaymentType.FC.text,
             value=PaymentType.FC.value,
             variable=self._payment_type_var,
+            command=on_payment_type_changed,
         )
         payment_fc_radio.pack(side="left", padx=(0, 15))
 
@@ -216,32 +270,21 @@ class UpsertAccountDialog:
             text=PaymentType.MC.text,
             value=PaymentType.MC.value,
             variable=self._payment_type_var,
+            command=on_payment_type_changed,
         )
         payment_mc_radio.pack(side="left")
 
     def _setup_spin_delay(self, parent: ttk.Frame) -> None:
         spin_delay_frame = ttk.Frame(master=parent)
         spin_delay_frame.pack(fill="x", pady=(0, 15))
-        ttk.Label(master=spin_delay_frame, text="Spin Delay (sec):", width=15, font=("Arial", 12)).pack(side="left")
-
-        def validate_spin_delay(value: str) -> bool:
-            if value == "":
-                return True
-
-            try:
-                float(value)
-                return True
-            except ValueError:
-                return False
+        spin_delay_label = ttk.Label(
+            master=spin_delay_frame, text="Spin Delay (sec):", width=15, style=self._FORM_LABEL_STYLE
+        )
+        spin_delay_label.pack(side="left")
 
-        vcmd = (parent.register(validate_spin_delay), "%P")
+        # No per-key validator: the value is parsed and checked once in _handle_save
         self._spin_delay_var = tk.StringVar(value=str(self._account.spin_delay_seconds if self._account else 0.0))
-        self._spin_delay_entry = UIFactory.create_entry(
-            parent=spin_delay_frame,
-            textvariable=self._spin_delay_var,
-            validate="key",
-            validatecommand=vcmd,
-        )
+        self._spin_delay_entry = UIFactory.create_entry(parent=spin_delay_frame, textvariable=self._spin_delay_var)
         self._spin_delay_entry.pack(side="left", padx=(10, 0), fill="x", expand=True)
 
     def _setup_buttons(self, parent: ttk.Frame) -> None:
@@ -264,25 +307,47 @@ class UpsertAccountDialog:
         )
         buttons_frame.pack(fill="x", pady=(0, 10))
 
+    def _on_return_key(self, event: tk.Event) -> None:
+        # Buttons keep their own activation - Enter on a focused Cancel must not save
+        if isinstance(event.widget, ttk.Button):
+            return
+
+        self._handle_save()
+
     def _handle_save(self) -> None:
+        # Read every form value once up front
+        username = self._username_var.get().strip()
+        password = self._pwd_var.get().strip()
+        target_sjp_str = self._target_sjp_var.get()
+        target_mjp_str = self._target_mjp_var.get().strip()
+        spin_type_index = self._spin_type_combobox.current()  # -1 when nothing valid is selected
+        spin_delay_str = self._spin_delay_var.get()
+        payment_type = PaymentType.from_int(self._payment_type_var.get())
+        close_on_jp_win = self._close_on_jp_win_var.get()
+
         # Validate username
-        if not (username := self._username_var.get().strip()):
+        if not username:
             messagebox.showerror("Error", "Username is required!")
             return
 
         # Validate password
-        if not (password := self._pwd_var.get().strip()):
+        if not password:
             messagebox.showerror("Error", "Password is required!")
             return
 
         # Validate target jackpot
-        if (target_val := self._target_sjp_var.get()) <= 0:
-            messagebox.showerror("Error", "Target Jackpot must be greater than 0!")
+        try:
+            target_val = int(target_sjp_str or "0")
+            if target_val <= 0:
+                messagebox.showerror("Error", "Target Jackpot must be greater than 0!")
+                return
+        except ValueError:
+            messagebox.showerror("Error", "Invalid Target Jackpot value!")
             return
 
         # Validate target mini jackpot (optional)
         target_mjp_val: Optional[int] = None
-        if target_mjp_str := self._target_mjp_var.get().strip():
+        if target_mjp_str:
             try:
                 target_mjp_val = int(target_mjp_str)
                 if target_mjp_val < 0:
@@ -292,17 +357,16 @@ class UpsertAccountDialog:
                 messagebox.showerror("Error", "Invalid Target Mini Jackpot value!")
                 return
 
-        # Parse spin action
-        spin_type_display = self._spin_type_var.get()
-        try:
-            spin_type_val = int(spin_type_display.split(".")[0])
-        except (ValueError, IndexError):
+        # Validate spin action
+        if spin_type_index < 0:
             messagebox.showerror("Error", "Invalid spin action selected!")
             return
 
+        spin_type_val = spin_type_index + 1
+
         # Validate spin delay
         try:
-            spin_delay_val = float(self._spin_delay_var.get() or "0")
+            spin_delay_val = float(spin_delay_str or "0")
             if spin_delay_val < 0:
                 messagebox.showerror("Error", "Spin Delay must be 0 or greater!")
                 return
@@ -310,41 +374,39 @@ class UpsertAccountDialog:
             messagebox.showerror("Error", "Invalid Spin Delay value!")
             return
 
-        # Handle different modes
-        if self._is_edit_mode and self._account:
-            if username != self._account.username and username in {a.username for a in self._existing_accounts}:
-                messagebox.showerror("Error", f"Account with username '{username}' already exists!")
-                return
+        # Validate username uniqueness - an unchanged username in edit mode skips the lookup
+        if username != self._original_username and username in self._existing_usernames:
+            messagebox.showerror("Error", f"Account with username '{username}' already exists!")
+            return
 
+        # Handle different modes
+        account = self._account
+        if self._is_edit_mode and account:
             # Update existing account
-            self._account.username = username
-            self._account.password = password
-            self._account.target_sjp = target_val
-            self._account.target_mjp = target_mjp_val
-            self._account.payment_type = PaymentType.from_int(self._payment_type_var.get())
-            self._account.spin_type = spin_type_val
-            self._account.spin_delay_seconds = spin_delay_val
-            self._account.close_on_jp_win = self._close_on_jp_win_var.get()
+            account.username = username
+            account.password = password
+            account.target_sjp = target_val
+            account.target_mjp = target_mjp_val
+            account.payment_type = payment_type
+            account.spin_type = spin_type_val
+            account.spin_delay_seconds = spin_delay_val
+            account.close_on_jp_win = close_on_jp_win
 
         else:  # Add mode
-            if username in {a.username for a in self._existing_accounts}:
-                messagebox.showerror("Error", f"Account with username '{username}' already exists!")
-                return
-
             # Create new account
-            self._account = Account(
+            self._account = account = Account(
                 username=username,
                 password=password,
                 target_sjp=target_val,
                 target_mjp=target_mjp_val,
-                payment_type=PaymentType.from_int(self._payment_type_var.get()),
+                payment_type=payment_type,
                 spin_type=spin_type_val,
                 spin_delay_seconds=spin_delay_val,
-                close_on_jp_win=self._close_on_jp_win_var.get(),
+                close_on_jp_win=close_on_jp_win,
             )
 
         # Call save callback
-        self._on_save(account=self._account, is_new=not self._is_edit_mode)
+        self._on_save(account=account, is_new=not self._is_edit_mode)
 
         action_text = "updated" if self._is_edit_mode else "created"
         messagebox.showinfo("Success", f"Account '{username}' {action_text} successfully!")
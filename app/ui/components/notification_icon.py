@@ -1,11 +1,13 @@
-import contextlib
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from app.core.managers.local_config import local_config_mgr
 from app.schemas.local_config import LocalConfigs, Notification
-from app.ui.components.dialogs.notification import NotificationDialog
+
+if TYPE_CHECKING:
+    from app.ui.components.dialogs.notification import NotificationDialog
 
 
 class NotificationIcon:
@@ -13,11 +15,17 @@ class NotificationIcon:
         # Widgets
         self._parent: tk.Misc = parent
         self._frame: ttk.Frame = ttk.Frame(master=parent)
-        self._dialog: Optional[NotificationDialog] = None
+        self._dialog: Optional["NotificationDialog"] = None
 
         # Configs
         self._local_configs: LocalConfigs = local_configs if local_configs else local_config_mgr.load_local_configs()
-        self._notifications: List[Notification] = self._local_configs.notifications
+        self._notifications: List[Notification] = self._local_configs.notifications  # Same list object, never rebound
+
+        # States
+        self._is_count_packed = False  # Badge pack state, tracked here to skip redundant pack/pack_forget calls
+        self._save_job: Optional[str] = None
+        self._unread_count = sum(1 for notification in self._notifications if not notification.is_seen)
+        self._rendered_unread_count = -1  # Count the badge currently shows, -1 forces the first render
 
         self._initialize()
 
@@ -28,21 +36,26 @@ class NotificationIcon:
     # ==================== Public Methods ====================
     def add_notification(self, nickname: str, jackpot_value: str) -> None:
         self._notifications.append(Notification(nickname=nickname, jackpot_value=jackpot_value))
+        self._unread_count += 1
         self._update_count_badge()
         self._save_notifications_to_config()
 
     # ==================== Private Methods ====================
     def _initialize(self) -> None:
+        # Named fonts for the icon states - swapping them avoids re-parsing a font tuple on every badge update
+        self._icon_font = tkfont.Font(root=self._frame, family="Arial", size=16)
+        self._icon_bold_font = tkfont.Font(root=self._frame, family="Arial", size=16, weight="bold")
+
         # Notification icon button
         self._icon_label = ttk.Label(
             master=self._frame,
             cursor="hand2",
-            font=("Arial", 16),
+            font=self._icon_font,
             foreground="#fbbf24",
             text="🔔",
         )
         self._icon_label.pack(side="left")
-        self._icon_label.bind(sequence="<Button-1>", func=lambda _: self._on_icon_click())
+        self._icon_label.bind(sequence="<Button-1>", func=self._on_icon_click)
 
         # Notification count badge
         self._count_label = ttk.Label(
@@ -53,27 +66,37 @@ class NotificationIcon:
             padding=(4, 2),
             text="0",
         )
-        self._count_label.pack_forget()  # Initially hidden
 
         # Update icon to reflect loaded notifications
         self._update_count_badge()
 
-    def _on_icon_click(self) -> None:
-        # Close existing dialog if any
-        if self._dialog is not None:
-            with contextlib.suppress(tk.TclError):
-                self._dialog.destroy()
+    def _on_icon_click(self, _: tk.Event) -> None:
+        # Mark all notifications as seen - nothing to mark or save when there were no unread ones
+        if self._unread_count:
+            # New notifications are appended, so walk from the newest and stop once every unread one is flipped
+            remaining, self._unread_count = self._unread_count, 0
+            for notification in reversed(self._notifications):
+                if notification.is_seen:
+                    continue
 
-        # Mark all notifications as seen
-        for notification in self._notifications:
-            notification.is_seen = True
-        self._save_notifications_to_config()
+                notification.is_seen = True  # Plain write - Notification does not enable validate_assignment
+                remaining -= 1
+                if not remaining:
+                    break
+
+            self._save_notifications_to_config()
 
         # Remove count badge as all are now seen
-        if self._count_label.winfo_exists():
-            self._count_label.pack_forget()
+        self._update_count_badge()
+
+        # Reuse the notification dialog - it is only built on the first click and hidden when closed
+        if self._dialog is not None:
+            self._dialog.show()
+            return
+
+        # Imported on first use - the dialog module is not needed until the icon is clicked
+        from app.ui.components.dialogs.notification import NotificationDialog
 
-        # Create and show notification dialog
         self._dialog = NotificationDialog(
             parent=self._parent,
             notifications=self._notifications,
@@ -81,31 +104,54 @@ class NotificationIcon:
         )
 
     def _update_count_badge(self) -> None:
-        unread_count: int = sum(1 for notification in self._notifications if not notification.is_seen)
+        unread_count = self._unread_count
+        if unread_count == self._rendered_unread_count:
+            return
 
+        self._rendered_unread_count = unread_count
         if unread_count == 0:
-            self._icon_label.config(font=("Arial", 16), foreground="#6b7280")
-            self._count_label.pack_forget()
+            self._icon_label.config(font=self._icon_font, foreground="#6b7280")
+            self._hide_count_badge()
             return
 
         # Show notification count badge
-        self._icon_label.config(font=("Arial", 16, "bold"), foreground="#f97316")
-        self._count_label.config(
-            text=str(unread_count),
-            background="#ef4444",
-            font=("Arial", 10, "bold"),
-            foreground="#ffffff",
-        )
+        self._icon_label.config(font=self._icon_bold_font, foreground="#f97316")
+        self._count_label.config(text=str(unread_count))  # Colors and font are fixed at creation
+        self._show_count_badge()
+
+    def _show_count_badge(self) -> None:
+        if self._is_count_packed:
+            return
+
         self._count_label.pack()
+        self._is_count_packed = True
+
+    def _hide_count_badge(self) -> None:
+        if not self._is_count_packed:
+            return
+
+        self._count_label.pack_forget()
+        self._is_count_packed = False
 
     def _clear_all_notifications(self) -> None:
-        self._notifications.clear()
-        self._update_count_badge()
-        self._save_notifications_to_config()
+        # An empty list has nothing to clear or persist - only the dialog is closed
+        if self._notifications:
+            self._notifications.clear()
+            self._unread_count = 0
+            self._update_count_badge()
+            self._save_notifications_to_config()
 
         if self._dialog:
-            self._dialog.destroy()
+            self._dialog.hide()
 
     def _save_notifications_to_config(self) -> None:
-        self._local_configs.notifications = self._notifications
+        # Coalesce bursts of changes into a single write - the main window also saves these configs on close.
+        # A pending write already covers this change; not rescheduling keeps a steady stream from delaying it forever
+        if self._save_job is not None:
+            return
+
+        self._save_job = self._frame.after(200, self._flush_save_notifications)
+
+    def _flush_save_notifications(self) -> None:
+        self._save_job = None
         local_config_mgr.save_local_configs(configs=self._local_configs)
@@ -10,7 +10,7 @@ from app.schemas.local_config import Account, LocalConfigs
 from app.schemas.user_response import UserDetail
 from app.ui.components.dialogs.upsert_account import UpsertAccountDialog
 from app.ui.utils.ui_factory import UIFactory
-from app.utils.constants import BROWSER_POSITIONS
+from app.utils.constants import BROWSER_POSITIONS_FLAT
 from app.utils.types.callback import OnAccountRunCallback, OnAccountStopCallback, OnRefreshPageCallback
 
 
@@ -29,6 +29,8 @@ class AccountsTab:
         "Close on Won Special Jackpot": {"width": 140, "anchor": "center"},
     }
 
+    _TAG_STYLES = tuple((tag.name, tag.value[0], tag.value[1]) for tag in AccountTag)
+
     def __init__(
         self,
         parent: tk.Misc,
@@ -45,7 +47,8 @@ class AccountsTab:
         # Configs
         self._event_configs = event_configs
         self._local_configs = local_configs
-        self._accounts = self._local_configs.accounts
+        # Keyed by username, dicts keep insertion order so this is also the display order
+        self._accounts: Dict[str, Account] = {a.username: a for a in self._local_configs.accounts}
         self._selected_event = selected_event
 
         # Callbacks
@@ -57,6 +60,15 @@ class AccountsTab:
         self._running_usernames: Set[str] = set()
         self._browser_pos_by_username: Dict[str, str] = {}
         self._account_info_cache: Dict[str, UserDetail] = {}
+        self._iid_by_username: Dict[str, str] = {}
+        self._username_by_iid: Dict[str, str] = {}
+        self._spin_name_cache: Dict[Tuple[str, str], str] = {}
+        self._is_tree_refresh_pending = False
+        self._button_state_cache: Dict[ttk.Button, Tuple[str, Optional[str]]] = {}
+        self._is_save_pending = False
+        self._last_selection: Optional[Tuple[str, ...]] = None
+        self._selected_accounts: List[Account] = []
+        self._is_tree_populated = False
 
         self._initialize()
 
@@ -66,7 +78,7 @@ class AccountsTab:
 
     @property
     def accounts(self) -> List[Account]:
-        return self._accounts
+        return list(self._accounts.values())
 
     @property
     def selected_event(self) -> str:
@@ -102,9 +114,8 @@ class AccountsTab:
         ):
             return
 
-        accounts_to_delete_set = set(accounts)
-        current_accounts_set = set(self._accounts)
-        self._accounts = list(current_accounts_set - accounts_to_delete_set)
+        for account in accounts:
+            self._accounts.pop(account.username, None)
 
         self._save_accounts_to_config()
         self._update_accounts_tree()
@@ -112,9 +123,9 @@ class AccountsTab:
     def run_all_accounts(self, not_running_accounts: Optional[List[Account]] = None) -> None:
         not_running_accounts = not_running_accounts or [
             account
-            for account in self._accounts
+            for account in self._accounts.values()
             # Check not running, not won and not marked not run
-            if account.username not in self._running_usernames and account.available
+            if self._get_account_status(account=account)[1]
         ]
 
         if not not_running_accounts:
@@ -122,12 +133,9 @@ class AccountsTab:
             messagebox.showinfo("Info", message)
             return
 
-        for account in not_running_accounts:
-            self._on_account_run(account=account)
-            time.sleep(1)
-
-        self._running_usernames.update(a.username for a in not_running_accounts)
-        self._update_accounts_tree()
+        # Stagger launches one second apart without blocking the Tk loop
+        for i, account in enumerate(not_running_accounts):
+            self._frame.after(i * 1000, self._launch_account, account)
 
     def stop_all_accounts(self, running_usernames: Optional[Set[str]] = None) -> None:
         running_usernames = running_usernames or self._running_usernames
@@ -155,22 +163,22 @@ class AccountsTab:
             time.sleep(1)
 
     def mark_account_as_won(self, username: str) -> None:
-        account = next((a for a in self._accounts if a.username == username), None)
+        account = self._accounts.get(username)
         if not account:
             return
 
         account.has_won = True
         self._save_accounts_to_config()
-        self._save_accounts_to_config()
-        self._update_accounts_tree()
+        self._refresh_account_row(account=account)
 
     def update_browser_position(self, username: str, browser_index: int) -> None:
-        account = next((a for a in self._accounts if a.username == username), None)
+        account = self._accounts.get(username)
         if not account:
             return
 
-        row, col = divmod(browser_index, 2)
-        self._browser_pos_by_username[username] = BROWSER_POSITIONS.get((row, col), "Center")
+        self._browser_pos_by_username[username] = (
+            BROWSER_POSITIONS_FLAT[browser_index] if 0 <= browser_index < len(BROWSER_POSITIONS_FLAT) else "Center"
+        )
         self._update_information_frame(account=account, is_running=username in self._running_usernames)
 
     def update_account_info(self, username: str, user_detail: UserDetail) -> None:
@@ -227,8 +235,8 @@ class AccountsTab:
             self._accounts_tree.column(column=column, **config)  # type: ignore[call-overload]
 
         # Configure tags for colors
-        for tag in AccountTag:
-            self._accounts_tree.tag_configure(tag.name, background=tag.value[0], foreground=tag.value[1])
+        for tag_name, background, foreground in self._TAG_STYLES:
+            self._accounts_tree.tag_configure(tag_name, background=background, foreground=foreground)
 
         # Bind events
         self._accounts_tree.bind("<<TreeviewSelect>>", lambda _: self._on_tree_select())
@@ -237,7 +245,9 @@ class AccountsTab:
         self._accounts_tree.bind("<Control-A>", lambda _: self._on_select_all_accounts())
 
         self._accounts_tree.focus_set()
-        self._update_accounts_tree()
+
+        # Fill the tree the first time the tab is actually shown
+        self._frame.bind("<Map>", self._on_frame_map, add="+")
 
     def _setup_action_buttons(self, parent: ttk.Frame) -> None:
         self._right_frame = ttk.LabelFrame(master=parent, text="Actions", padding=10)
@@ -260,6 +270,7 @@ class AccountsTab:
         self._mark_not_run_btn = UIFactory.create_button(
             parent=management_container,
             text="Mark Not Run",
+            command=self._on_mark_not_run_click,
             width=15,
             state="disabled",
         )
@@ -268,6 +279,7 @@ class AccountsTab:
         self._edit_btn = UIFactory.create_button(
             parent=management_container,
             text="Edit",
+            command=self._on_edit_click,
             width=15,
             state="disabled",
         )
@@ -276,6 +288,7 @@ class AccountsTab:
         self._delete_btn = UIFactory.create_button(
             parent=self._right_frame,
             text="Delete",
+            command=self._on_delete_click,
             width=15,
             state="disabled",
         )
@@ -292,6 +305,7 @@ class AccountsTab:
         self._run_btn = UIFactory.create_button(
             parent=control_container,
             text="Run",
+            command=self._on_run_click,
             style="Accent.TButton",
             width=15,
             state="disabled",
@@ -301,6 +315,7 @@ class AccountsTab:
         self._stop_btn = UIFactory.create_button(
             parent=control_container,
             text="Stop",
+            command=self._on_stop_click,
             style="Accent.TButton",
             width=15,
             state="disabled",
@@ -311,6 +326,7 @@ class AccountsTab:
         self._refresh_btn = UIFactory.create_button(
             parent=self._right_frame,
             text="Refresh Page",
+            command=self._on_refresh_click,
             style="Accent.TButton",
             width=15,
             state="disabled",
@@ -361,16 +377,23 @@ class AccountsTab:
         )
         self._accumulation_label.pack(anchor="w", pady=(0, 2))
 
-    def _on_tree_select(self) -> None:
+    def _on_tree_select(self, force: bool = False) -> None:
+        # <<TreeviewSelect>> can fire repeatedly for the same selection
+        selection = self._accounts_tree.selection()
+        if not force and selection == self._last_selection:
+            return
+
+        self._last_selection = selection
         selected_accounts = self._get_selected_accounts()
+        self._selected_accounts = selected_accounts
 
         if not selected_accounts:
-            self._mark_not_run_btn.config(state="disabled")
-            self._edit_btn.config(state="disabled")
-            self._delete_btn.config(state="disabled")
-            self._run_btn.config(state="disabled")
-            self._stop_btn.config(state="disabled")
-            self._refresh_btn.config(state="disabled")
+            self._set_button_state(button=self._mark_not_run_btn, state="disabled")
+            self._set_button_state(button=self._edit_btn, state="disabled")
+            self._set_button_state(button=self._delete_btn, state="disabled")
+            self._set_button_state(button=self._run_btn, state="disabled")
+            self._set_button_state(button=self._stop_btn, state="disabled")
+            self._set_button_state(button=self._refresh_btn, state="disabled")
             self._browser_pos_label.config(text=self._BROWSER_POS_LABEL_TEXT.format(position="-"), foreground="#6b7280")
             self._fc_label.config(text=self._FC_LABEL_TEXT.format(value="-"), foreground="#6b7280")
             self._mc_label.config(text=self._MC_LABEL_TEXT.format(value="-"), foreground="#6b7280")
@@ -384,15 +407,13 @@ class AccountsTab:
             self._handle_multiple_selection(selected_accounts)
 
     def _get_selected_accounts(self) -> List[Account]:
-        selected_items = self._accounts_tree.selection()
+        # Resolve through the iid map, no per-item Tcl round-trip for the row values
+        username_by_iid = self._username_by_iid
+        accounts_by_username = self._accounts
         selected_accounts = []
 
-        for item_id in selected_items:
-            values = self._accounts_tree.item(item=item_id, option="values")
-            if not values:
-                continue
-
-            account = next((a for a in self._accounts if a.username == values[0]), None)
+        for item_id in self._accounts_tree.selection():
+            account = accounts_by_username.get(username_by_iid.get(item_id, ""))
             if not account:
                 continue
 
@@ -404,46 +425,46 @@ class AccountsTab:
         is_running = account.username in self._running_usernames
         is_marked_not_run = account.marked_not_run
         is_winning = account.has_won
+        _, is_runnable = self._get_account_status(account=account)
 
-        self._mark_not_run_btn.config(
-            command=lambda: self._toggle_mark_not_run(account=account),
+        self._set_button_state(
+            button=self._mark_not_run_btn,
             state="disabled" if is_running or is_winning else "normal",
             text="Mark Run" if is_marked_not_run else "Mark Not Run",
         )
 
-        self._edit_btn.config(
-            command=lambda: self._open_upsert_dialog(account=account),
-            state="disabled" if is_winning else "normal",
-        )
+        self._set_button_state(button=self._edit_btn, state="disabled" if is_winning else "normal")
 
-        self._delete_btn.config(
-            command=lambda: self._delete_account(account=account),
-            state="disabled" if is_running else "normal",
-        )
+        self._set_button_state(button=self._delete_btn, state="disabled" if is_running else "normal")
 
-        self._run_btn.config(
-            command=lambda: self._run_account(account=account),
-            state="disabled" if is_running or is_marked_not_run or is_winning else "normal",
+        self._set_button_state(
+            button=self._run_btn,
+            state="normal" if is_runnable else "disabled",
             text="Run",
         )
 
-        self._stop_btn.config(
-            command=lambda: self._stop_account(username=account.username),
-            state="normal" if is_running else "disabled",
-            text="Stop",
-        )
+        self._set_button_state(button=self._stop_btn, state="normal" if is_running else "disabled", text="Stop")
 
-        self._refresh_btn.config(
-            command=lambda: self._refresh_page(username=account.username),
-            state="normal" if is_running else "disabled",
-        )
+        self._set_button_state(button=self._refresh_btn, state="normal" if is_running else "disabled")
 
         self._update_information_frame(account=account, is_running=is_running)
 
+    def _set_button_state(self, button: ttk.Button, state: str, text: Optional[str] = None) -> None:
+        # Skip the Tk round-trip when the button already shows this state/text
+        key = (state, text)
+        if self._button_state_cache.get(button) == key:
+            return
+
+        self._button_state_cache[button] = key
+        if text is None:
+            button.config(state=state)
+        else:
+            button.config(state=state, text=text)
+
     def _toggle_mark_not_run(self, account: Account) -> None:
         account.marked_not_run = not account.marked_not_run
         self._save_accounts_to_config()
-        self._update_accounts_tree()
+        self._refresh_account_row(account=account)
 
     def _delete_account(self, account: Account) -> None:
         if not messagebox.askyesno(
@@ -453,7 +474,7 @@ class AccountsTab:
         ):
             return
 
-        self._accounts.remove(account)
+        self._accounts.pop(account.username, None)
         self._save_accounts_to_config()
         self._update_accounts_tree()
 
@@ -472,7 +493,16 @@ class AccountsTab:
 
         self._on_account_run(account=account)
         self._running_usernames.add(account.username)
-        self._update_accounts_tree()
+        self._refresh_account_row(account=account)
+
+    def _launch_account(self, account: Account) -> None:
+        # State may have changed while this launch was queued
+        if not self._get_account_status(account=account)[1]:
+            return
+
+        self._on_account_run(account=account)
+        self._running_usernames.add(account.username)
+        self._refresh_account_row(account=account)
 
     def _stop_account(self, username: str) -> None:
         if username not in self._running_usernames:
@@ -481,7 +511,10 @@ class AccountsTab:
 
         self._on_account_stop(username=username)
         self._running_usernames.remove(username)
-        self._update_accounts_tree()
+
+        account = self._accounts.get(username)
+        if account:
+            self._refresh_account_row(account=account)
 
     def _refresh_page(self, username: str) -> None:
         if username not in self._running_usernames:
@@ -491,39 +524,88 @@ class AccountsTab:
         self._on_refresh_page(username=username)
 
     def _handle_multiple_selection(self, accounts: List[Account]) -> None:
-        self._edit_btn.config(state="disabled")
+        self._set_button_state(button=self._edit_btn, state="disabled")
 
-        not_running_accounts = [a for a in accounts if a.username not in self._running_usernames and a.available]
-        running_usernames = {a.username for a in accounts if a.username in self._running_usernames}
+        not_running_accounts, running_usernames = self._split_accounts_by_status(accounts=accounts)
 
-        self._mark_not_run_btn.config(
-            command=lambda: self.toggle_all_mark_not_run(accounts=accounts),
+        self._set_button_state(
+            button=self._mark_not_run_btn,
             state="disabled" if len(running_usernames) > 0 else "normal",
             text="Toggle Selected",
         )
 
-        self._delete_btn.config(
-            command=lambda: self.delete_all_accounts(accounts=accounts),
+        self._set_button_state(
+            button=self._delete_btn,
             state="disabled" if len(running_usernames) > 0 else "normal",
             text="Delete Selected",
         )
 
-        self._run_btn.config(
-            command=lambda: self.run_all_accounts(not_running_accounts=not_running_accounts),
-            state="normal" if len(not_running_accounts) > 0 else "disabled",
-            text="Run Selected",
+        self._set_button_state(
+            button=self._run_btn, state="normal" if len(not_running_accounts) > 0 else "disabled", text="Run Selected"
         )
 
-        self._stop_btn.config(
-            command=lambda: self.stop_all_accounts(running_usernames=running_usernames),
-            state="normal" if len(running_usernames) > 0 else "disabled",
-            text="Stop Selected",
+        self._set_button_state(
+            button=self._stop_btn, state="normal" if len(running_usernames) > 0 else "disabled", text="Stop Selected"
         )
 
-        self._refresh_btn.config(
-            command=lambda: self.refresh_all_pages(running_usernames=running_usernames),
-            state="normal" if len(running_usernames) > 0 else "disabled",
-        )
+        self._set_button_state(button=self._refresh_btn, state="normal" if len(running_usernames) > 0 else "disabled")
+
+    def _split_accounts_by_status(self, accounts: List[Account]) -> Tuple[List[Account], Set[str]]:
+        # Split the selection in a single pass
+        not_running_accounts: List[Account] = []
+        running_usernames: Set[str] = set()
+        for account in accounts:
+            tag_name, is_runnable = self._get_account_status(account=account)
+            if tag_name == AccountTag.RUNNING.name:
+                running_usernames.add(account.username)
+            elif is_runnable:
+                not_running_accounts.append(account)
+
+        return not_running_accounts, running_usernames
+
+    # Action buttons are bound once and dispatch on the current selection
+    def _on_mark_not_run_click(self) -> None:
+        if len(self._selected_accounts) == 1:
+            self._toggle_mark_not_run(account=self._selected_accounts[0])
+        elif self._selected_accounts:
+            self.toggle_all_mark_not_run(accounts=self._selected_accounts)
+
+    def _on_edit_click(self) -> None:
+        if len(self._selected_accounts) == 1:
+            self._open_upsert_dialog(account=self._selected_accounts[0])
+
+    def _on_delete_click(self) -> None:
+        if len(self._selected_accounts) == 1:
+            self._delete_account(account=self._selected_accounts[0])
+        elif self._selected_accounts:
+            self.delete_all_accounts(accounts=self._selected_accounts)
+
+    def _on_run_click(self) -> None:
+        if len(self._selected_accounts) == 1:
+            self._run_account(account=self._selected_accounts[0])
+            return
+
+        not_running_accounts, _ = self._split_accounts_by_status(accounts=self._selected_accounts)
+        if not_running_accounts:
+            self.run_all_accounts(not_running_accounts=not_running_accounts)
+
+    def _on_stop_click(self) -> None:
+        if len(self._selected_accounts) == 1:
+            self._stop_account(username=self._selected_accounts[0].username)
+            return
+
+        _, running_usernames = self._split_accounts_by_status(accounts=self._selected_accounts)
+        if running_usernames:
+            self.stop_all_accounts(running_usernames=running_usernames)
+
+    def _on_refresh_click(self) -> None:
+        if len(self._selected_accounts) == 1:
+            self._refresh_page(username=self._selected_accounts[0].username)
+            return
+
+        _, running_usernames = self._split_accounts_by_status(accounts=self._selected_accounts)
+        if running_usernames:
+            self.refresh_all_pages(running_usernames=running_usernames)
 
     def _on_tree_double_click(self) -> None:
         selected_items = self._accounts_tree.selection()
@@ -531,12 +613,7 @@ class AccountsTab:
             messagebox.showwarning("Warning", "Please select an account to process.")
             return
 
-        item_id = selected_items[0]
-        values = self._accounts_tree.item(item=item_id, option="values")
-        if not values:
-            return
-
-        account = next((a for a in self._accounts if a.username == values[0]), None)
+        account = self._accounts.get(self._username_by_iid.get(selected_items[0], ""))
         if not account:
             return
 
@@ -549,7 +626,13 @@ class AccountsTab:
     def _open_upsert_dialog(self, account: Optional[Account] = None) -> None:
         def on_save(account: Account, is_new: bool) -> None:
             if is_new:
-                self._accounts.append(account)
+                self._accounts[account.username] = account
+            else:
+                # The username may have been edited in place, re-key while keeping the order
+                self._accounts = {a.username: a for a in self._accounts.values()}
+
+            # Spin type or payment type may have changed (or the username itself)
+            self._spin_name_cache.clear()
 
             self._save_accounts_to_config()
             self._update_accounts_tree()
@@ -558,7 +641,7 @@ class AccountsTab:
             parent=self._frame,
             event_configs=self._event_configs,
             selected_event=self._selected_event,
-            existing_accounts=self._accounts,
+            existing_accounts=list(self._accounts.values()),
             account=account,
             on_save=on_save,
         )
@@ -571,77 +654,132 @@ class AccountsTab:
             browser_pos = self._browser_pos_by_username.get(account.username, "Unknown")
             browser_color = "#22c55e" if browser_pos != "Unknown" else "#6b7280"
 
-        widgets_configs = {
-            self._browser_pos_label: {
-                "text": self._BROWSER_POS_LABEL_TEXT.format(position=browser_pos),
-                "foreground": browser_color,
-            },
-        }
+        self._browser_pos_label.config(
+            text=self._BROWSER_POS_LABEL_TEXT.format(position=browser_pos),
+            foreground=browser_color,
+        )
 
         user_detail = self._account_info_cache.get(account.username)
-        if user_detail:
-            fc_val = f"{user_detail.fc:,}" if user_detail.fc is not None else "-"
-            mc_val = f"{user_detail.mc:,}" if user_detail.mc is not None else "-"
-            fs_val = f"{user_detail.free_spin:,}" if user_detail.free_spin is not None else "-"
-            acc_val = f"{user_detail.accumulation:,}" if user_detail.accumulation is not None else "-"
-
-            widgets_configs[self._fc_label] = {
-                "text": self._FC_LABEL_TEXT.format(value=fc_val),
-                "foreground": "#22c55e",
-            }
-            widgets_configs[self._mc_label] = {
-                "text": self._MC_LABEL_TEXT.format(value=mc_val),
-                "foreground": "#22c55e",
-            }
-            widgets_configs[self._free_spin_label] = {
-                "text": self._FREE_SPIN_LABEL_TEXT.format(value=fs_val),
-                "foreground": "#22c55e",
-            }
-            widgets_configs[self._accumulation_label] = {
-                "text": self._ACCUMULATION_LABEL_TEXT.format(value=acc_val),
-                "foreground": "#22c55e",
-            }
-        else:
-            widgets_configs[self._fc_label] = {"text": self._FC_LABEL_TEXT.format(value="-"), "foreground": "#6b7280"}
-            widgets_configs[self._mc_label] = {"text": self._MC_LABEL_TEXT.format(value="-"), "foreground": "#6b7280"}
-            widgets_configs[self._free_spin_label] = {
-                "text": self._FREE_SPIN_LABEL_TEXT.format(value="-"),
-                "foreground": "#6b7280",
-            }
-            widgets_configs[self._accumulation_label] = {
-                "text": self._ACCUMULATION_LABEL_TEXT.format(value="-"),
-                "foreground": "#6b7280",
-            }
-
-        for label_widget, cofnigs in widgets_configs.items():
-            label_widget.config(**cofnigs)
+        if not user_detail:
+            self._fc_label.config(text=self._FC_LABEL_TEXT.format(value="-"), foreground="#6b7280")
+            self._mc_label.config(text=self._MC_LABEL_TEXT.format(value="-"), foreground="#6b7280")
+            self._free_spin_label.config(text=self._FREE_SPIN_LABEL_TEXT.format(value="-"), foreground="#6b7280")
+            self._accumulation_label.config(text=self._ACCUMULATION_LABEL_TEXT.format(value="-"), foreground="#6b7280")
+            return
+
+        fc_val = f"{user_detail.fc:,}" if user_detail.fc is not None else "-"
+        mc_val = f"{user_detail.mc:,}" if user_detail.mc is not None else "-"
+        fs_val = f"{user_detail.free_spin:,}" if user_detail.free_spin is not None else "-"
+        acc_val = f"{user_detail.accumulation:,}" if user_detail.accumulation is not None else "-"
+
+        self._fc_label.config(text=self._FC_LABEL_TEXT.format(value=fc_val), foreground="#22c55e")
+        self._mc_label.config(text=self._MC_LABEL_TEXT.format(value=mc_val), foreground="#22c55e")
+        self._free_spin_label.config(text=self._FREE_SPIN_LABEL_TEXT.format(value=fs_val), foreground="#22c55e")
+        self._accumulation_label.config(text=self._ACCUMULATION_LABEL_TEXT.format(value=acc_val), foreground="#22c55e")
+
+    def _get_account_status(self, account: Account) -> Tuple[str, bool]:
+        # Single source for the row tag and whether the account can be started
+        if account.username in self._running_usernames:
+            return AccountTag.RUNNING.name, False
+
+        if account.marked_not_run:
+            return AccountTag.MARKED_NOT_RUN.name, False
+
+        if account.has_won:
+            return AccountTag.WINNER.name, False
+
+        return AccountTag.STOPPED.name, True
+
+    def _build_account_row(self, account: Account) -> Tuple[Tuple[str], Tuple]:
+        tag_name, _ = self._get_account_status(account=account)
+        tags = (tag_name,)
+
+        cache_key = (account.username, self._selected_event)
+        spin_name = self._spin_name_cache.get(cache_key)
+        if spin_name is None:
+            spin_name = account.spin_type_name(event_configs=self._event_configs, selected_event=self._selected_event)
+            self._spin_name_cache[cache_key] = spin_name
+
+        values = (
+            account.username,
+            account.target_sjp,
+            account.target_mjp if account.target_mjp is not None else "-",
+            spin_name,
+            account.close_on_jp_win,
+        )
+
+        return tags, values
+
+    def _on_frame_map(self, _: tk.Event) -> None:
+        if self._is_tree_populated:
+            return
+
+        self._is_tree_populated = True
+        self._update_accounts_tree()
 
     def _update_accounts_tree(self) -> None:
-        self._accounts_tree.delete(*self._accounts_tree.get_children())
+        # Nothing to rebuild until the first populate, it will pick up the latest state
+        if not self._is_tree_populated:
+            return
+
+        # Coalesce back-to-back rebuild requests into one per event loop iteration
+        if self._is_tree_refresh_pending:
+            return
+
+        self._is_tree_refresh_pending = True
+        self._frame.after_idle(self._do_refresh_accounts_tree)
 
-        for account in self._accounts:
-            conditions: List[Tuple[bool, Tuple[str]]] = [
-                (account.username in self._running_usernames, (AccountTag.RUNNING.name,)),
-                (account.marked_not_run, (AccountTag.MARKED_NOT_RUN.name,)),
-                (account.has_won, (AccountTag.WINNER.name,)),
-            ]
-            tags = next((tag for cond, tag in conditions if cond), (AccountTag.STOPPED.name,))
-
-            self._accounts_tree.insert(
-                parent="",
-                index=0,
-                tags=tags,
-                values=(
-                    account.username,
-                    account.target_sjp,
-                    account.target_mjp if account.target_mjp is not None else "-",
-                    account.spin_type_name(event_configs=self._event_configs, selected_event=self._selected_event),
-                    account.close_on_jp_win,
-                ),
+    def _do_refresh_accounts_tree(self) -> None:
+        # Full rebuild, only for initial load and bulk changes (add/delete/edit/event switch)
+        self._is_tree_refresh_pending = False
+        self._last_selection = None  # Item ids change on rebuild
+        self._accounts_tree.delete(*self._accounts_tree.get_children())
+        self._iid_by_username.clear()
+        self._username_by_iid.clear()
+
+        # Call the Tcl command directly to skip Treeview.insert's per-row option formatting
+        tk_call = self._accounts_tree.tk.call
+        tree_path = str(self._accounts_tree)
+        for account in self._accounts.values():
+            tags, values = self._build_account_row(account=account)
+            iid = tk_call(
+                tree_path,
+                "insert",
+                "",
+                0,
+                "-tags",
+                tags,
+                "-values",
+                tuple(str(value) for value in values),
             )
+            self._iid_by_username[account.username] = iid
+            self._username_by_iid[iid] = account.username
 
         self._left_frame.config(text=f"Accounts ({len(self._accounts)})")
 
+    def _refresh_account_row(self, account: Account) -> None:
+        iid = self._iid_by_username.get(account.username)
+        if not iid:
+            self._update_accounts_tree()
+            return
+
+        tags, values = self._build_account_row(account=account)
+        self._accounts_tree.item(iid, tags=tags, values=values)
+
+        # The row stays selected, so re-derive the button states from its new status
+        if iid in self._accounts_tree.selection():
+            self._on_tree_select(force=True)
+
     def _save_accounts_to_config(self) -> None:
-        self._local_configs.accounts = self._accounts
+        self._local_configs.accounts = list(self._accounts.values())
+
+        # Coalesce disk writes into one per event loop iteration
+        if self._is_save_pending:
+            return
+
+        self._is_save_pending = True
+        self._frame.after_idle(self._flush_save_accounts)
+
+    def _flush_save_accounts(self) -> None:
+        self._is_save_pending = False
         local_config_mgr.save_local_configs(configs=self._local_configs)
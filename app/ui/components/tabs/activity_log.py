@@ -1,34 +1,59 @@
+import queue
+import threading
+import time
 import tkinter as tk
-from collections import deque
-from datetime import datetime
+from collections import defaultdict, deque
+from dataclasses import dataclass
 from tkinter import ttk
-from typing import Deque, Dict, Tuple
-
-from pydantic import BaseModel, ConfigDict
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
 
 from app.schemas.enums.message_tag import MessageTag
 from app.ui.utils.ui_factory import UIFactory
 from app.ui.utils.ui_helpers import UIHelpers
 from app.utils.constants import DUPLICATE_WINDOW_SECONDS
 
-
-class MessageTabInfo(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
+# Per-tag lookups resolved once, the message path only does dict hits
+_TAG_NAME: Dict[MessageTag, str] = {tag: tag.name for tag in MessageTag}
+_TAG_TABS: Dict[MessageTag, Tuple[str, ...]] = {
+    # Everything but websocket traffic is mirrored to "All" (dict.fromkeys drops the repeat for DEFAULT)
+    tag: tuple(dict.fromkeys(("All", tag.tab_name))) if tag != MessageTag.WEBSOCKET else (tag.tab_name,)
+    for tag in MessageTag
+}
+_TAG_FONTS: Dict[str, Tuple[Any, ...]] = {
+    tag.name: ("Arial", 12, "bold") if tag != MessageTag.DEFAULT else ("Arial", 12) for tag in MessageTag
+}
+_TAG_COLORS: Dict[str, str] = {tag.name: tag.value for tag in MessageTag}
+
+# Tag configuration as Tcl subcommands, prefixed with the widget path and sent in a single eval per Text widget
+_TAG_CONFIG_COMMANDS: Tuple[str, ...] = tuple(
+    f"tag configure {tag_name} -foreground {_TAG_COLORS[tag_name]} -font {{{' '.join(map(str, font))}}}"
+    for tag_name, font in _TAG_FONTS.items()
+)
+
+
+@dataclass(slots=True)
+class MessageTabInfo:
     frame: ttk.Frame
     text_widget: tk.Text
-    scrollbar: ttk.Scrollbar
+    scrollbar: Optional[ttk.Scrollbar]
+    line_count: int = 0
 
 
 class ActivityLogTab:
     _TABS = ["All", "Game Events", "Rewards", "System", "WebSockets"]
+    _TAB_NAMES = frozenset(_TABS)
 
     _CURRENT_JACKPOT_LABEL_TEXT = "Current Jackpot: {value:,}"
     _JACKPOT_WINNER_TEXT = "Ultimate Prize Winner: {nickname} ({value})"
     _MINI_JACKPOT_WINNER_TEXT = "Mini Prize Winner: {nickname} ({value})"
 
-    # Cache size - keep last N messages for duplicate detection
-    _MAX_RECENT_MESSAGES = 100
+    # Ring buffer - drop the oldest lines in batches once a tab grows past the cap
+    _MAX_LINES = 2000
+    _TRIM_BATCH = 200
+
+    # Inbox pump - how long to coalesce a burst before draining, and how much to drain per Tk tick
+    _DRAIN_INTERVAL_MS = 20
+    _DRAIN_BATCH_SIZE = 256
 
     def __init__(self, parent: tk.Misc) -> None:
         # Widgets
@@ -37,8 +62,21 @@ class ActivityLogTab:
         # States
         self._message_tabs: Dict[str, MessageTabInfo] = {}  # Format: { tab_name: MessageTabInfo }
 
-        # Cache for duplicate detection: deque of (message_content, timestamp_dt)
-        self._recent_messages: Deque[Tuple[str, datetime]] = deque(maxlen=self._MAX_RECENT_MESSAGES)
+        # Thread-safe inbox drained on the Tk thread, format: (tag, message, compact, created_at, monotonic_at)
+        self._inbox: queue.Queue[Tuple[MessageTag, str, bool, float, float]] = queue.Queue()
+        self._inbox_lock = threading.Lock()
+        self._is_drain_scheduled = False  # Guarded by _inbox_lock, a drain is only armed while the inbox has work
+
+        # Sliding window for duplicate detection: arrival order + content lookup, both bounded by the window
+        self._recent_messages: Deque[Tuple[str, float]] = deque()  # Format: (message_content, monotonic_at)
+        self._recent_message_set: Set[str] = set()
+
+        # Messages queued for the next flush, format: { tab_name: [(tag, message)] }
+        self._pending_messages: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+
+        # "All" mirrors every tab, so it is only materialized while selected; older lines would be trimmed anyway
+        self._all_tab_backlog: Deque[Tuple[str, str]] = deque(maxlen=self._MAX_LINES)
+        self._is_all_tab_selected = True  # First tab of the notebook
 
         self._initialize()
 
@@ -58,40 +96,41 @@ class ActivityLogTab:
         self._mini_prize_label.config(text=self._MINI_JACKPOT_WINNER_TEXT.format(nickname=nickname, value=value))
 
     def add_message(self, tag: MessageTag, message: str, compact: bool = False) -> None:
-        if not message.strip():
-            return
-
-        now = datetime.now()
-        timestamp = now.strftime("%d/%m/%Y %H:%M:%S")
-
-        if compact:
-            message_content = self._extract_message_content(message=message)
-
-            # Fast duplicate check using in-memory cache
-            if self._is_duplicate_message(message_content=message_content, now=now):
+        # Safe from any thread, the Tk-side work happens in _drain_inbox
+        with self._inbox_lock:
+            # Wall clock for the displayed time, monotonic clock for the dedupe window (immune to clock steps)
+            self._inbox.put_nowait((tag, message, compact, time.time(), time.monotonic()))
+            if self._is_drain_scheduled:
                 return
 
-            # Add to cache for future duplicate checks
-            self._recent_messages.append((message_content, now))
-
-            timestamped_message = f"[{timestamp}] {message_content}"
-        else:
-            timestamped_message = f"[{timestamp}] {message.strip()}"
+            self._is_drain_scheduled = True
 
-        if tag != MessageTag.WEBSOCKET:
-            self._add_message_to_tab(tab_name="All", tag=tag.name, message=timestamped_message)
-        self._add_message_to_tab(tab_name=tag.tab_name, tag=tag.name, message=timestamped_message)
+        # First message into an idle inbox - arm a single drain, no polling while nothing arrives
+        self._frame.after(self._DRAIN_INTERVAL_MS, self._drain_inbox)
 
     def clear_messages(self) -> None:
+        # Drop lines still queued from before the clear, an armed drain then finds the inbox empty
+        with self._inbox_lock:
+            try:
+                while True:
+                    self._inbox.get_nowait()
+            except queue.Empty:
+                pass
+
         # Clear text widgets
         for tab_info in self._message_tabs.values():
             text_widget = tab_info.text_widget
             text_widget.config(state="normal")
             text_widget.delete("1.0", tk.END)
             text_widget.config(state="disabled")
+            tab_info.line_count = 0
+
+        self._pending_messages.clear()
+        self._all_tab_backlog.clear()
 
         # Clear duplicate detection cache
         self._recent_messages.clear()
+        self._recent_message_set.clear()
 
         self.update_current_jackpot(value=0)
         self.update_prize_winner(nickname="Unknown", value="0", is_jackpot=True)
@@ -161,6 +200,7 @@ class ActivityLogTab:
 
         # Setup focus management using helper
         UIHelpers.setup_focus_management(root_or_frame=self._frame, notebook=self._notebook)
+        self._notebook.bind("<<NotebookTabChanged>>", lambda _: self._on_messages_tab_changed(), add="+")
 
     def _create_message_tab(self, tab_name: str) -> None:
         tab_frame = ttk.Frame(master=self._notebook)
@@ -177,9 +217,8 @@ class ActivityLogTab:
         )
 
         # Configure tags for this text widget
-        for tag in MessageTag:
-            font = ("Arial", 12, "bold") if tag != MessageTag.DEFAULT else ("Arial", 12)
-            text_widget.tag_configure(tagName=tag.name, foreground=tag.value, font=font)
+        text_path = str(text_widget)
+        text_widget.tk.eval("\n".join(f"{text_path} {command}" for command in _TAG_CONFIG_COMMANDS))
 
         # Prevent unwanted text selection using helper
         UIHelpers.prevent_text_selection(text_widget=text_widget)
@@ -196,47 +235,123 @@ class ActivityLogTab:
         )
 
     def _extract_message_content(self, message: str) -> str:
-        if "]" in message and message.startswith("["):
-            end_bracket = message.find("]")
-            if end_bracket != -1:
-                content = message[end_bracket + 1 :].strip()
-                return content
+        if not message.startswith("["):
+            return message.strip()
 
-        return message.strip()
+        # Drop the leading "[...]" prefix in a single scan
+        _, separator, content = message.partition("]")
+        return (content if separator else message).strip()
 
-    def _is_duplicate_message(self, message_content: str, now: datetime) -> bool:
-        """Check if message is duplicate using in-memory cache.
+    def _is_duplicate_message(self, message_content: str, now: float) -> bool:
+        """Check if message is duplicate within the last DUPLICATE_WINDOW_SECONDS.
 
-        Performance: O(n) where n = min(100, total_messages)
-        Much faster than parsing text widgets which is O(n*m*k)
+        Performance: O(1) amortized, expired entries are evicted from the left of the window
         """
-        for cached_content, cached_time in reversed(self._recent_messages):
-            # Stop checking if we've gone past the duplicate window
-            time_diff = abs((now - cached_time).total_seconds())
-            if time_diff > DUPLICATE_WINDOW_SECONDS:
+        recent_messages = self._recent_messages
+        while recent_messages and now - recent_messages[0][1] > DUPLICATE_WINDOW_SECONDS:
+            expired_content, _ = recent_messages.popleft()
+            self._recent_message_set.discard(expired_content)
+
+        return message_content in self._recent_message_set
+
+    def _drain_inbox(self) -> None:
+        for _ in range(self._DRAIN_BATCH_SIZE):
+            try:
+                tag, message, compact, created_at, monotonic_at = self._inbox.get_nowait()
+            except queue.Empty:
                 break
 
-            # Check if content matches
-            if cached_content == message_content:
-                return True
+            self._process_message(
+                tag=tag, message=message, compact=compact, created_at=created_at, monotonic_at=monotonic_at
+            )
+
+        if self._pending_messages:
+            self._flush_pending_messages()
 
-        return False
+        # Come back right away while a burst is still queued, otherwise disarm until add_message sees new work
+        with self._inbox_lock:
+            if self._inbox.empty():
+                self._is_drain_scheduled = False
+                return
+
+        self._frame.after(0, self._drain_inbox)
+
+    def _process_message(
+        self, tag: MessageTag, message: str, compact: bool, created_at: float, monotonic_at: float
+    ) -> None:
+        stripped_message = message.strip()
+        if not stripped_message:
+            return
+
+        if compact:
+            message_content = self._extract_message_content(message=message)
+
+            # Fast duplicate check using in-memory cache
+            if self._is_duplicate_message(message_content=message_content, now=monotonic_at):
+                return
+
+            # Add to cache for future duplicate checks
+            self._recent_messages.append((message_content, monotonic_at))
+            self._recent_message_set.add(message_content)
+        else:
+            message_content = stripped_message
+
+        # Display time is formatted only for messages that survive the duplicate check
+        timestamp = time.strftime("%d/%m/%Y %H:%M:%S", time.localtime(created_at))
+        timestamped_message = f"[{timestamp}] {message_content}"
+
+        tag_name = _TAG_NAME[tag]
+        for tab_name in _TAG_TABS[tag]:
+            self._add_message_to_tab(tab_name=tab_name, tag=tag_name, message=timestamped_message)
 
     def _add_message_to_tab(self, tab_name: str, tag: str, message: str) -> None:
-        if tab_name not in self._message_tabs:
+        if tab_name not in self._TAB_NAMES:
+            return
+
+        # Inserted in one batch per tab at the end of the current drain
+        self._pending_messages[tab_name].append((tag, message))
+
+    def _on_messages_tab_changed(self) -> None:
+        self._is_all_tab_selected = self._notebook.select() == str(self._message_tabs["All"].frame)
+        if not self._is_all_tab_selected or not self._all_tab_backlog:
             return
 
-        text_widget = self._message_tabs[tab_name].text_widget
+        self._insert_messages(tab_name="All", messages=self._all_tab_backlog)
+        self._all_tab_backlog.clear()
+
+    def _flush_pending_messages(self) -> None:
+        for tab_name, messages in self._pending_messages.items():
+            if not messages:
+                continue
+
+            if tab_name == "All" and not self._is_all_tab_selected:
+                self._all_tab_backlog.extend(messages)
+                continue
+
+            self._insert_messages(tab_name=tab_name, messages=messages)
+
+        self._pending_messages.clear()
+
+    def _insert_messages(self, tab_name: str, messages: Iterable[Tuple[str, str]]) -> None:
+        tab_info = self._message_tabs[tab_name]
+        text_widget = tab_info.text_widget
         text_widget.config(state="normal")
 
-        current_text = text_widget.get("1.0", tk.END).strip()
-        if current_text:
-            text_widget.insert(tk.END, "\n")
+        # Text.insert takes (chars, tags) pairs, so the whole batch goes in one call with its tags applied
+        insert_args: List[Any] = []
+        for tag, message in messages:
+            if tab_info.line_count > 0:
+                insert_args.extend(("\n", ()))
+
+            insert_args.extend((message, tag))
+            tab_info.line_count += message.count("\n") + 1
+
+        text_widget.insert(tk.END, *insert_args)
 
-        start_pos = text_widget.index(tk.END + "-1c linestart")
-        text_widget.insert(tk.END, message)
-        end_pos = text_widget.index(tk.END + "-1c")
+        if tab_info.line_count > self._MAX_LINES:
+            trim_count = tab_info.line_count - self._MAX_LINES + self._TRIM_BATCH
+            text_widget.delete("1.0", f"{trim_count + 1}.0")
+            tab_info.line_count -= trim_count
 
-        text_widget.tag_add(tag, start_pos, end_pos)
         text_widget.see(tk.END)
         text_widget.config(state="disabled")
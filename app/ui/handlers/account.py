@@ -1,7 +1,11 @@
 # mypy: disable-error-code="union-attr"
 
+import threading
+from collections import deque
 from tkinter import ttk
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Deque, Dict, Optional
+
+from loguru import logger
 
 from app.schemas.enums.message_tag import MessageTag
 from app.schemas.local_config import Account
@@ -26,6 +30,11 @@ class AccountHandler(BaseHandler):
         # States
         self._running_services = running_services
 
+        # UI outbox - callbacks from service threads are drained in one Tk frame
+        self._ui_outbox: Deque[Callable[[], None]] = deque()
+        self._ui_outbox_lock = threading.Lock()
+        self._ui_drain_scheduled = False
+
         # Widgets
         self._event_combobox: Optional[ttk.Combobox] = None
         self._auto_refresh_checkbox: Optional[ttk.Checkbutton] = None
@@ -134,6 +143,30 @@ class AccountHandler(BaseHandler):
         self._stop_all_accounts_btn.config(state="normal" if bool(total_running_services) else "disabled")
         self._refresh_all_pages_btn.config(state="normal" if bool(total_running_services) else "disabled")
 
+    def _schedule_ui(self, callback: Callable[[], None]) -> None:
+        # Called from service threads: queue the callback and schedule at most one pending drain
+        with self._ui_outbox_lock:
+            self._ui_outbox.append(callback)
+            if self._ui_drain_scheduled:
+                return
+
+            self._ui_drain_scheduled = True
+
+        self._root.after(ms=0, func=self._drain_ui_outbox)
+
+    def _drain_ui_outbox(self) -> None:
+        with self._ui_outbox_lock:
+            callbacks = list(self._ui_outbox)
+            self._ui_outbox.clear()
+            self._ui_drain_scheduled = False
+
+        # One failing callback must not drop the rest of the batch
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as error:
+                logger.exception(f"UI callback failed: {error}")
+
     def _build_callbacks(self, account: Account) -> Dict[str, Callable[..., None]]:
         def on_account_won(username: str) -> None:
             def _cb() -> None:
@@ -141,37 +174,37 @@ class AccountHandler(BaseHandler):
                 if account.close_on_jp_win:
                     self.stop_account(username=username)
 
-            self._root.after(ms=0, func=_cb)
+            self._schedule_ui(callback=_cb)
 
         def on_update_account_info(username: str, user_detail: UserDetail) -> None:
             def _cb() -> None:
                 self._accounts_tab.update_account_info(username=username, user_detail=user_detail)
 
-            self._root.after(ms=0, func=_cb)
+            self._schedule_ui(callback=_cb)
 
         def on_update_current_jackpot(value: int) -> None:
             def _cb() -> None:
                 self._activity_log_tab.update_current_jackpot(value=value)
 
-            self._root.after(ms=0, func=_cb)
+            self._schedule_ui(callback=_cb)
 
         def on_update_prize_winner(nickname: str, value: str, is_jackpot: bool = False) -> None:
             def _cb() -> None:
                 self._activity_log_tab.update_prize_winner(nickname=nickname, value=value, is_jackpot=is_jackpot)
 
-            self._root.after(ms=0, func=_cb)
+            self._schedule_ui(callback=_cb)
 
         def on_add_message(tag: MessageTag, message: str, compact: bool = False) -> None:
             def _cb() -> None:
                 self._activity_log_tab.add_message(tag=tag, message=f"[{account.username}] {message}", compact=compact)
 
-            self._root.after(ms=0, func=_cb)
+            self._schedule_ui(callback=_cb)
 
         def on_add_notification(nickname: str, jackpot_value: str) -> None:
             def _cb() -> None:
                 self._notification_icon.add_notification(nickname=nickname, jackpot_value=jackpot_value)
 
-            self._root.after(ms=0, func=_cb)
+            self._schedule_ui(callback=_cb)
 
         # Auto-collect inner functions
         callbacks = {name: fn for name, fn in locals().items() if callable(fn) and name.startswith("on_")}
@@ -1,6 +1,6 @@
 import tkinter as tk
 from tkinter import ttk
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 
 class UIFactory:
@@ -89,7 +89,7 @@ class UIFactory:
     def create_combobox(
         parent: tk.Misc,
         textvariable: Optional[tk.StringVar] = None,
-        values: Optional[List[str]] = None,
+        values: Optional[Sequence[str]] = None,
         width: int = 25,
         font: Tuple[str, int] = ("Arial", 12),
         state: str = "readonly",
@@ -100,7 +100,7 @@ class UIFactory:
         Args:
             parent: Parent widget
             textvariable: Variable to bind to combobox
-            values: List of combobox values
+            values: Sequence of combobox values
             width: Combobox width
             font: Combobox font
             state: Combobox state
@@ -180,6 +180,7 @@ class UIFactory:
         widget_type: str = "entry",
         label_width: int = 15,
         label_font: Tuple[str, int] = ("Arial", 12),
+        label_style: Optional[str] = None,
         **widget_kwargs: Any,
     ) -> Tuple[ttk.Frame, tk.Widget]:
         """Create a form row with label and input widget.
@@ -190,6 +191,7 @@ class UIFactory:
             widget_type: Type of widget ("entry", "combobox", "text")
             label_width: Label width
             label_font: Label font
+            label_style: Named ttk style for the label; takes precedence over label_font
             **widget_kwargs: Arguments to pass to widget creation
 
         Returns:
@@ -197,7 +199,10 @@ class UIFactory:
         """
         frame = ttk.Frame(master=parent)
 
-        label = ttk.Label(master=frame, text=label_text, width=label_width, font=label_font)
+        if label_style:
+            label = ttk.Label(master=frame, text=label_text, width=label_width, style=label_style)
+        else:
+            label = ttk.Label(master=frame, text=label_text, width=label_width, font=label_font)
         label.pack(side="left")
 
         if widget_type == "entry":
@@ -1,4 +1,4 @@
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 
 DUPLICATE_WINDOW_SECONDS: int = 60
 
@@ -8,3 +8,6 @@ BROWSER_POSITIONS: Dict[Tuple[int, int], str] = {
     (1, 0): "Bottom-Left",
     (1, 1): "Bottom-Right",
 }
+
+# Same positions indexed by browser index (row-major, 2 columns)
+BROWSER_POSITIONS_FLAT: List[str] = [BROWSER_POSITIONS[divmod(i, 2)] for i in range(len(BROWSER_POSITIONS))]
@@ -21,7 +21,11 @@ def format_results_block(results: List[SpinResult]) -> str:
     return "\n".join(lines)
 
 
-def get_window_position(child_frame: tk.Misc, parent_frame: Optional[tk.Misc] = None) -> WP_TYPE:
+def get_window_position(
+    child_frame: tk.Misc,
+    parent_frame: Optional[tk.Misc] = None,
+    size: Optional[Tuple[int, int]] = None,
+) -> WP_TYPE:
     """Calculate positioning coordinates for centering a child window.
 
     This function calculates the position to center a child frame either relative
@@ -35,6 +39,10 @@ def get_window_position(child_frame: tk.Misc, parent_frame: Optional[tk.Misc] =
             relative to. If provided, the child will be centered within the parent
             window's bounds. If None, the child will be centered on the screen.
             Defaults to None.
+        size (Optional[Tuple[int, int]], optional): The (width, height) to center
+            instead of the child's current size - e.g. a fixed dialog size, or the
+            requested size (winfo_reqwidth/winfo_reqheight) of a window that is still
+            withdrawn and has not been mapped yet. Defaults to None.
 
     Returns:
         Tuple[int, int, int, int, int, int]: A tuple containing positioning information:
@@ -58,8 +66,11 @@ def get_window_position(child_frame: tk.Misc, parent_frame: Optional[tk.Misc] =
         parent_x = 0
         parent_y = 0
 
-    child_frame_width = child_frame.winfo_width()
-    child_frame_height = child_frame.winfo_height()
+    if size is not None:
+        child_frame_width, child_frame_height = size
+    else:
+        child_frame_width = child_frame.winfo_width()
+        child_frame_height = child_frame.winfo_height()
 
     x = parent_x + (window_width // 2) - (child_frame_width // 2)
     y = parent_y + (window_height // 2) - (child_frame_height // 2)